@@ -0,0 +1,39 @@
+"""
+total time and output size of a big table at every compression level, compressing the pages on output, as they
+are closed, and in a pool of threads as they are closed. best of 3 runs.
+
+    python -m benchmarks.bench_compression
+"""
+from __future__ import annotations
+
+import time
+import zlib
+
+from fpdf_table import PDFTable
+
+ROWS = [[str(i), f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}', f'{i * 37 % 10000}.00',
+         'lorem ipsum dolor sit amet ' * (1 + i % 4)] for i in range(10000)]
+LEVELS = (0, 1, zlib.Z_DEFAULT_COMPRESSION, 9)
+MODES = {
+    'output': {},
+    'released': {'release_closed_pages': True},
+    'threads': {'compression_workers': 4},
+}
+
+
+def draw(level: int, attributes: dict) -> tuple[float, int]:
+    start = time.perf_counter()
+    pdf = PDFTable()
+    pdf.compression_level = level
+    for key, value in attributes.items():
+        setattr(pdf, key, value)
+    pdf.table_rows(ROWS, pdf.table_cols(1, 2, 2, 7))
+    size = len(pdf.output())
+    return time.perf_counter() - start, size
+
+
+if __name__ == '__main__':
+    for level in LEVELS:
+        for mode, attributes in MODES.items():
+            runs = [draw(level, attributes) for _ in range(3)]
+            print(f'level {level:2d} {mode:8s}: {min(seconds for seconds, _ in runs):.2f} s, {runs[0][1]} bytes')
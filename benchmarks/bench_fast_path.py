@@ -0,0 +1,75 @@
+"""
+share of the cells of a table of mixed data (ids, dates, amounts and descriptions) that skip the line breaker
+because they fit in one line, and rows per second of responsive and fixed rows with and without the fast path. the
+text cache is disabled so every cell is measured. best of 3 runs.
+
+    python -m benchmarks.bench_fast_path
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from fpdf_table import PDFTable
+
+ROWS = 4000
+WORDS = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor'.split()
+
+
+class CountingPDFTable(PDFTable):
+    """
+    counts the texts checked by the fast path and the ones that fit in one line.
+    """
+    text_cache_size = 0
+
+    def __init__(self):
+        self.checked = 0
+        self.fast = 0
+        super().__init__()
+
+    def check_text_fits_line(self, w, txt):
+        fits = super().check_text_fits_line(w, txt)
+        self.checked += 1
+        self.fast += fits
+        return fits
+
+
+class BreakerPDFTable(PDFTable):
+    """
+    breaks every text in lines, like before the fast path.
+    """
+    text_cache_size = 0
+
+    def check_text_fits_line(self, w, txt):
+        return False
+
+    def calculate_text_capacity(self, w, row_quantity):
+        return sys.maxsize
+
+
+def create_rows() -> list[list[str]]:
+    generator = random.Random(0)
+    return [[f'INV-{generator.randint(10000, 99999)}',
+             f'2024-{generator.randint(1, 12):02d}-{generator.randint(1, 28):02d}',
+             f'{generator.uniform(1, 99999):.2f}',
+             ' '.join(generator.choices(WORDS, k=generator.choice([2, 3, 12, 25])))] for _ in range(ROWS)]
+
+
+def draw(pdf: PDFTable, rows: list[list[str]], option: str) -> float:
+    columns = pdf.table_cols(2, 2, 2, 6)
+    start = time.perf_counter()
+    for row in rows:
+        pdf.table_row(row, columns, option=option, fixed_height=10)
+    return ROWS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    rows = create_rows()
+    for option in ('responsive', 'fixed'):
+        counting = CountingPDFTable()
+        draw(counting, rows, option)
+        fast = max(draw(CountingPDFTable(), rows, option) for _ in range(3))
+        breaker = max(draw(BreakerPDFTable(), rows, option) for _ in range(3))
+        print(f'{option}: {counting.fast / counting.checked:.0%} of {counting.checked} texts take the fast path, '
+              f'{breaker:.0f} -> {fast:.0f} rows/s ({fast / breaker:.2f}x)')
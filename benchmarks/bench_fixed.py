@@ -0,0 +1,58 @@
+"""
+operators, output bytes and rows per second of a document of draw_row_fixed rows, drawing the containers with
+draw_container and with cell_fixed as before. pages are not compressed, so the operators can be counted. best of 3
+runs.
+
+    python -m benchmarks.bench_fixed
+"""
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+
+from fpdf_table import PDFTable
+
+ROWS = 3000
+WORDS = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor'.split()
+TEXTS = [[f'{i}', ' '.join(WORDS[i % 7:i % 7 + 3]), ' '.join(WORDS * (1 + i % 3)), f'{i * 37 % 1000}.00']
+         for i in range(ROWS)]
+# literal strings of the content, so the text is not counted as operators
+STRING = re.compile(rb'\((?:\\.|[^\\)])*\)')
+OPERATOR = re.compile(rb'(?<![\w/])(?:[A-Za-z*\'"]{1,3})(?![\w])')
+
+
+class CellFixedPDFTable(PDFTable):
+    """
+    draws the containers with the bordered cell and the positioning cell of cell_fixed.
+    """
+
+    def draw_container(self, container_width, container_height, line_break=False, inline=False):
+        self.cell_fixed(container_width, container_height, line_break=line_break, inline=inline)
+
+
+def draw(pdf_class: type[PDFTable]) -> tuple[float, bytes]:
+    pdf = pdf_class()
+    pdf.set_compression(False)
+    columns = pdf.table_cols(1, 3, 6, 2)
+    start = time.perf_counter()
+    for texts in TEXTS:
+        pdf.table_row(texts, columns, option='fixed', fixed_height=10)
+    rows_per_second = ROWS / (time.perf_counter() - start)
+    content = b''.join(bytes(pdf.get_page_content(n)) for n in range(1, pdf.page + 1))
+    pdf.output()
+    return rows_per_second, content
+
+
+def count_operators(content: bytes) -> Counter:
+    return Counter(OPERATOR.findall(STRING.sub(b'', content)))
+
+
+if __name__ == '__main__':
+    for name, pdf_class in (('cell_fixed', CellFixedPDFTable), ('draw_container', PDFTable)):
+        runs = [draw(pdf_class) for _ in range(3)]
+        content = runs[0][1]
+        operators = count_operators(content)
+        print(f'{name}: {max(rows for rows, _ in runs):.0f} rows/s, {len(content)} bytes, '
+              f'{sum(operators.values())} operators')
+        print('    ' + ', '.join(f'{op.decode()} {count}' for op, count in sorted(operators.items())))
@@ -0,0 +1,46 @@
+"""
+documents per second drawn by new PDFTable instances and by instances of a PDFTablePool, with a TTF font and an
+image. best of 3 runs.
+
+    python -m benchmarks.bench_pool
+"""
+import time
+
+from PIL import Image
+
+from fpdf_table import PDFTable, PDFTablePool
+from tests.utils import create_pdf_lato
+
+DOCUMENTS = 200
+IMAGE = Image.new('RGB', (200, 200), (30, 120, 200))
+ROWS = [[str(i), f'name {i}', f'{i * 37 % 1000}'] for i in range(40)]
+
+
+def draw(pdf: PDFTable):
+    pdf.image(IMAGE, w=20)
+    pdf.set_font('Lato', '', pdf.text_normal_size)
+    columns = pdf.table_cols(2, 6, 4)
+    pdf.table_header(['id', 'name', 'amount'], columns)
+    pdf.table_rows(ROWS, columns)
+    pdf.output()
+
+
+def bench_new() -> float:
+    start = time.perf_counter()
+    for _ in range(DOCUMENTS):
+        draw(create_pdf_lato())
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+def bench_pool() -> float:
+    pool = PDFTablePool(create_pdf_lato, max_size=1)
+    start = time.perf_counter()
+    for _ in range(DOCUMENTS):
+        with pool.pdf() as pdf:
+            draw(pdf)
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print(f'new instance: {max(bench_new() for _ in range(3)):.0f} docs/s')
+    print(f'pool:         {max(bench_pool() for _ in range(3)):.0f} docs/s')
@@ -0,0 +1,35 @@
+"""
+documents per second drawn serially and by 4 threads, with the documents of the multi-threaded tests: TTF and core
+fonts, grid borders, bands and a shared TableStyle. with the GIL threads don't draw faster, on free threaded
+builds they should. best of 3 runs.
+
+    python -m benchmarks.bench_threads
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.test_threads import draw_new
+
+DOCUMENTS = 64
+
+
+def bench_serial() -> float:
+    start = time.perf_counter()
+    for n in range(DOCUMENTS):
+        draw_new(n)
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+def bench_threads() -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(draw_new, range(DOCUMENTS)))
+    return DOCUMENTS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    serial = max(bench_serial() for _ in range(3))
+    threaded = max(bench_threads() for _ in range(3))
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'serial {serial:.1f} docs/s, 4 threads {threaded:.1f} docs/s ({threaded / serial:.2f}x), gil {gil}')
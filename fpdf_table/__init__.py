@@ -1,3 +1,18 @@
-from fpdf_table.main import PDFTable
+from fpdf_table.main import PDFTable, TableSpec, ColumnSpec, TextFlow
+from fpdf_table.style import TableStyle, StyleRule, CellStyle
 from fpdf.enums import Align, XPos, YPos
-from fpdf_table.main import add_image_local, resize_image
\ No newline at end of file
+from fpdf_table.main import add_image_local, resize_image
+
+
+def __getattr__(name):
+    # optional parts are imported on first use to keep `import fpdf_table` fast
+    if name == 'PDFTablePool':
+        from fpdf_table.pool import PDFTablePool
+        return PDFTablePool
+    if name == 'MemoryDiagnostics':
+        from fpdf_table.memory import MemoryDiagnostics
+        return MemoryDiagnostics
+    if name == 'IncrementalRenderer':
+        from fpdf_table.incremental import IncrementalRenderer
+        return IncrementalRenderer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    bounded mapping that drops the least recently used entries when it's full, and counts hits and misses.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        :param maxsize: maximum number of entries, 0 disables the cache
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        get a value and mark it as recently used.
+
+        :param key: key
+        :param default: returned if key isn't cached
+        :return: value
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        save a value, if the cache is full the least recently used entry is dropped.
+
+        :param key: key
+        :param value: value
+        :return:
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        """
+        change the maximum number of entries, the least recently used entries that don't fit are dropped.
+
+        :param maxsize: maximum number of entries, 0 disables the cache
+        :return:
+        """
+        self.maxsize = maxsize
+        while len(self._data) > max(maxsize, 0):
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        drop all entries and reset the statistics.
+
+        :return:
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        statistics of the cache, like functools.lru_cache.
+
+        :return: CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable):
+        return key in self._data
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple
+
+from fpdf.ttfonts import TTFontFile
+
+
+class FontMetrics(NamedTuple):
+    """
+    immutable metrics of a font file, parsed once per process and shared by every PDFTable, also between threads.
+    """
+    name: str
+    # font descriptor written to the PDF
+    desc: Mapping[str, int | str]
+    # underline position and thickness
+    up: int
+    ut: int
+    # width of every glyph, by unicode code point
+    cw: tuple[int, ...]
+    # size of the font file
+    size: int
+    # width of the narrowest glyph, see PDFTable.get_min_glyph_width
+    min_width: float
+
+
+# parsed font files, by path, modification time and size
+font_metrics: dict[tuple[str, int, int], FontMetrics] = {}
+font_metrics_lock = threading.Lock()
+
+
+def calculate_min_width(widths: Iterable[int], missing_width: int | None) -> float:
+    """
+    width of the narrowest glyph of a font.
+
+    :param widths: width of every glyph
+    :param missing_width: width of the characters without glyph, fpdf uses 500 if it's not defined
+    :return: width, 0 if the font has glyphs without width
+    """
+    missing_width = missing_width or 500
+    width = min(min(widths, default=missing_width), missing_width)
+    # 65535 is a glyph without width
+    return 0 if width == 65535 else width
+
+
+def load_font_metrics(path: Path) -> FontMetrics:
+    """
+    metrics of a TrueType or OpenType font file, the file is parsed only the first time.
+
+    :param path: font file
+    :return: FontMetrics
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    metrics = font_metrics.get(key)
+    if metrics is None:
+        # parse the file once even if many threads add the font at the same time
+        with font_metrics_lock:
+            metrics = font_metrics.get(key)
+            if metrics is None:
+                ttf = TTFontFile()
+                ttf.getMetrics(path)
+                desc = {
+                    'Ascent': round(ttf.ascent),
+                    'Descent': round(ttf.descent),
+                    'CapHeight': round(ttf.capHeight),
+                    'Flags': ttf.flags,
+                    'FontBBox': f'[{ttf.bbox[0]:.0f} {ttf.bbox[1]:.0f} {ttf.bbox[2]:.0f} {ttf.bbox[3]:.0f}]',
+                    'ItalicAngle': int(ttf.italicAngle),
+                    'StemV': round(ttf.stemV),
+                    'MissingWidth': round(ttf.defaultWidth),
+                }
+                metrics = FontMetrics(re.sub('[ ()]', '', ttf.fullName), MappingProxyType(desc),
+                                      round(ttf.underlinePosition), round(ttf.underlineThickness),
+                                      tuple(ttf.charWidths), stat.st_size,
+                                      calculate_min_width(ttf.charWidths, desc['MissingWidth']))
+                font_metrics[key] = metrics
+    return metrics
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from typing import TYPE_CHECKING, NamedTuple
+
+import fpdf
+from fpdf.enums import Align
+
+from fpdf_table.main import TableSpec
+from fpdf_table.style import TableStyle
+
+if TYPE_CHECKING:
+    from fpdf_table.main import PDFTable
+
+# change it when the content written for the same inputs changes, so old cache entries are not used
+CACHE_VERSION = 1
+
+
+class RenderStats(NamedTuple):
+    # pages drawn because their inputs or layout changed
+    rendered: int
+    # pages taken from the cache
+    cached: int
+
+
+class IncrementalRenderer:
+    """
+    draw a table keeping the content of every page in a cache directory. pages are planned with the row heights
+    and hashed with the rows that land on them and everything that changes how they look, so rendering the same
+    report again only draws the pages whose rows or layout changed.
+
+    pages drawn with TTF fonts are always drawn, their content depends on the glyphs used by the whole document.
+
+    the keys of the pages used by the renders are recorded, call prune after the last render of a report to delete
+    the pages no render used.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        :param cache_dir: directory where the content of the pages is saved, it's created if it doesn't exist
+        """
+        self.cache_dir = cache_dir
+        # keys of the pages loaded or saved since the renderer was created or pruned
+        self.used_keys = set()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def render_table(self, pdf: PDFTable, header: list[str] | None, rows: list[list[str]],
+                     width_list: list[float] | TableSpec = [], align: list[Align] | Align = Align.L,
+                     option: str = 'line', fixed_height: float = None, max_rows: int | None = None,
+                     max_height: float | None = None, style: TableStyle | None = None) -> RenderStats:
+        """
+        draw a table from the current position, with the header repeated on every page. the arguments are the
+        same of table_header and table_rows.
+
+        :param pdf: PDFTable
+        :param header: list of the texts of the header or None
+        :param rows: list of rows, every row is a list of texts
+        :param width_list: list of width´s for every column or a TableSpec
+        :param align: alignment of the rows
+        :param option: define what type of row to draw
+        :param fixed_height: height if option is fixed
+        :param max_rows: maximum number of rows if option is responsive
+        :param max_height: maximum height if option is responsive
+        :param style: TableStyle
+        :return: RenderStats
+        """
+        # borders collected before the table belong to the content before the table
+        pdf.draw_grid()
+        styles = style.calculate_styles(rows) if style is not None else [None] * len(rows)
+        # load the fonts of the header, rows and cell styles, cached pages don't load them
+        if header:
+            pdf.set_font(pdf.font, 'B', pdf.text_title_size)
+        font_styles = {cell_style.font_style for cell_styles in styles if cell_styles for cell_style in cell_styles
+                       if cell_style is not None and cell_style.font_style is not None}
+        for font_style in sorted(font_styles):
+            pdf.set_font(pdf.font, font_style, pdf.text_normal_size)
+        pdf.set_defaults()
+        cacheable = not any(font.get('type') == 'TTF' for font in pdf.fonts.values())
+        heights = [pdf.calculate_row_height(row, width_list, align, option, fixed_height, max_rows, max_height,
+                                            cell_styles) for row, cell_styles in zip(rows, styles)]
+        header_height = pdf.row_height_cell if header else 0
+        layout = self.calculate_layout_key(pdf, header, width_list, align, option, fixed_height, max_rows,
+                                           max_height)
+        rendered, cached = 0, 0
+        # pages are broken by the plan, the rows never trigger a page break
+        auto_page_break = pdf.auto_page_break
+        pdf.set_auto_page_break(False, pdf.b_margin)
+        try:
+            start = 0
+            while start < len(rows):
+                # a new page for every page of the plan, and for the first one if the header and a row don't fit
+                if start or pdf.y > pdf.t_margin and pdf.y + header_height + heights[start] > pdf.page_break_trigger:
+                    pdf.add_page()
+                # rows that fit in this page, at least one
+                y = pdf.y + header_height
+                end = start
+                while end < len(rows) and (end == start or y + heights[end] <= pdf.page_break_trigger):
+                    y += heights[end]
+                    end += 1
+                page = pdf.pages[pdf.page]
+                key = self.calculate_page_key(layout, bytes(page['content']), pdf.page, pdf.y, rows[start:end],
+                                              styles[start:end])
+                if cacheable:
+                    self.used_keys.add(key)
+                content = self.load(key) if cacheable else None
+                if content is None:
+                    if header:
+                        pdf.table_header(header, width_list)
+                    for row, cell_styles in zip(rows[start:end], styles[start:end]):
+                        pdf.table_row(row, width_list, align, option, fixed_height, max_rows, max_height,
+                                      cell_styles)
+                    pdf.draw_grid()
+                    pdf.set_defaults()
+                    if cacheable:
+                        self.save(key, bytes(page['content']))
+                    rendered += 1
+                else:
+                    # leave fpdf in the state it would be after drawing the page
+                    pdf.set_defaults()
+                    page['content'] = bytearray(content)
+                    pdf.set_xy(pdf.l_margin, y)
+                    cached += 1
+                start = end
+        finally:
+            pdf.set_auto_page_break(auto_page_break, pdf.b_margin)
+        return RenderStats(rendered, cached)
+
+    @staticmethod
+    def calculate_layout_key(pdf: PDFTable, header: list[str] | None, width_list: list[float] | TableSpec,
+                             align: list[Align] | Align, option: str, fixed_height: float | None,
+                             max_rows: int | None, max_height: float | None) -> tuple:
+        """
+        everything but the rows that changes the content of the pages.
+
+        :param pdf: PDFTable
+        :param header: list of the texts of the header or None
+        :param width_list: list of width´s for every column or a TableSpec
+        :param align: alignment of the rows
+        :param option: define what type of row to draw
+        :param fixed_height: height if option is fixed
+        :param max_rows: maximum number of rows if option is responsive
+        :param max_height: maximum height if option is responsive
+        :return: tuple
+        """
+        if isinstance(width_list, TableSpec):
+            width_list = (width_list.widths, width_list.aligns)
+        return (CACHE_VERSION, fpdf.__version__, header, width_list, align, option, fixed_height, max_rows,
+                max_height, pdf.font, pdf.text_normal_size, pdf.text_title_size, pdf.row_height_cell,
+                pdf.row_height_multi_cell, pdf.grid_borders, pdf.w, pdf.h, pdf.l_margin, pdf.r_margin, pdf.t_margin,
+                pdf.b_margin, pdf.c_margin, pdf.line_width, pdf.text_color, pdf.draw_color, pdf.fill_color,
+                tuple((name, font['i']) for name, font in pdf.fonts.items()))
+
+    @staticmethod
+    def calculate_page_key(layout: tuple, prefix: bytes, page: int, y: float, rows: list[list[str]],
+                           styles: list | None = None) -> str:
+        """
+        hash of a page.
+
+        :param layout: key returned by calculate_layout_key
+        :param prefix: content of the page before the table
+        :param page: page number
+        :param y: y position where the table starts
+        :param rows: rows drawn in the page
+        :param styles: cell styles of the rows drawn in the page
+        :return: hex digest
+        """
+        digest = hashlib.sha256(repr((layout, page, y)).encode())
+        digest.update(prefix)
+        digest.update(repr(rows).encode())
+        if styles is not None and any(styles):
+            digest.update(repr(styles).encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> bytes | None:
+        """
+        read the content of a page from the cache.
+
+        :param key: page hash
+        :return: content or None if it's not cached
+        """
+        try:
+            with open(os.path.join(self.cache_dir, f'{key}.bin'), 'rb') as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, content: bytes):
+        """
+        write the content of a page to the cache, the file is replaced atomically.
+
+        :param key: page hash
+        :param content: content of the page
+        :return:
+        """
+        descriptor, path = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(content)
+        os.replace(path, os.path.join(self.cache_dir, f'{key}.bin'))
+
+    def prune(self) -> int:
+        """
+        delete the pages of the cache that weren't used by the renders since the renderer was created or the last
+        prune, and start recording again.
+
+        :return: number of pages deleted
+        """
+        deleted = 0
+        for name in os.listdir(self.cache_dir):
+            key, extension = os.path.splitext(name)
+            if extension == '.bin' and key not in self.used_keys:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+        self.used_keys = set()
+        return deleted
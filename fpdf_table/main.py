@@ -3,13 +3,28 @@ from __future__ import annotations
 import functools
 import math
 import os
+import sys
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Sequence, Tuple
 
 from fpdf import FPDF
-from fpdf.enums import Align, XPos, YPos
-from fpdf.line_break import MultiLineBreak, TextLine
-from PIL import Image
-import base64
-import io
+from fpdf.enums import Align, DocumentState, XPos, YPos
+from fpdf.fpdf import FPDF_FONT_DIR, SubsetMap
+from fpdf.line_break import SOFT_HYPHEN, MultiLineBreak, TextLine
+from fpdf.syntax import create_stream as pdf_stream
+from fpdf.syntax import iobj_ref as pdf_ref
+from fpdf.util import object_id_for_page
+
+from fpdf_table.cache import LRUCache
+from fpdf_table.fonts import calculate_min_width, load_font_metrics
+from fpdf_table.style import CellStyle, TableStyle
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    # the image helpers import PIL on first use
+    from PIL import Image
+    from fpdf_table.memory import MemoryDiagnostics
 
 
 class PDFTable(FPDF):
@@ -22,6 +37,35 @@ class PDFTable(FPDF):
     row_height_multi_cell: float = 5  # mm
     # font
     font: str = 'Helvetica'
+    # fpdf configuration kept by reset()
+    reset_keep_attributes: tuple[str, ...] = ('l_margin', 't_margin', 'r_margin', 'c_margin', 'auto_page_break',
+                                              'b_margin', 'page_break_trigger', 'zoom_mode', 'layout_mode',
+                                              'compress', 'pdf_version', 'image_filter', 'allow_images_transparency',
+                                              'oversized_images', 'oversized_images_ratio', 'core_fonts_encoding',
+                                              'font_aliases', 'str_alias_nb_pages')
+    # compress the content of every page as soon as it's closed, only if compress is enabled
+    release_closed_pages: bool = False
+    # zlib level of the page content, 1 is the fastest i.e. for previews, 9 the smallest i.e. for archival
+    compression_level: int = zlib.Z_DEFAULT_COMPRESSION
+    # if greater than 0, pages are compressed by a pool of threads as soon as they are closed
+    compression_workers: int = 0
+    # set with enable_memory_diagnostics
+    memory_diagnostics: MemoryDiagnostics | None = None
+    # collect the borders of the cells and stroke them once per page as a grid of unique lines, see draw_grid
+    grid_borders: bool = False
+    # entries of the text measurement cache, 0 disables it, and maximum length of the cached texts. changes apply
+    # to the next measured text
+    text_cache_size: int = 1024
+    text_cache_max_length: int = 200
+    # keep the data of the images after output, so reset() can reuse them, set by PDFTablePool
+    keep_image_data: bool = False
+    # configuration copied from the class to every instance, so changing it in one document, i.e. the font set by
+    # add_fonts_custom, never changes another document rendered at the same time
+    instance_attributes: tuple[str, ...] = ('text_normal_size', 'text_title_size', 'row_height_cell',
+                                            'row_height_multi_cell', 'font', 'release_closed_pages',
+                                            'compression_level', 'compression_workers', 'memory_diagnostics',
+                                            'grid_borders', 'text_cache_size', 'text_cache_max_length',
+                                            'keep_image_data')
 
     def __init__(self):
         """
@@ -29,6 +73,24 @@ class PDFTable(FPDF):
         :return:
         """
         super().__init__()
+        for attribute in self.instance_attributes:
+            setattr(self, attribute, getattr(self, attribute))
+        # created when the first page is compressed if compression_workers is greater than 0
+        self.compression_executor: ThreadPoolExecutor | None = None
+        # normalized text and line breaks of repeated values, kept by reset()
+        self.text_cache = LRUCache(self.text_cache_size)
+        # narrowest glyph of every font, see get_min_glyph_width
+        self.min_glyph_widths: dict[str, float] = {}
+        self.start_document()
+
+    def start_document(self):
+        """
+        add the first page, set the default font and colors.
+
+        :return:
+        """
+        # borders collected in grid_borders mode, grouped by draw color and line width
+        self.grid_cells: dict[tuple, list[tuple[float, float, float, float]]] = {}
         self.add_page()
         self.set_font(self.font, '', self.text_normal_size)
         # black text
@@ -38,6 +100,254 @@ class PDFTable(FPDF):
         # gray container
         self.set_fill_color(220, 220, 220)
 
+    def reset(self):
+        """
+        clear pages and content to render a new document with the same instance. fonts added with add_font, cached
+        images, the attributes in reset_keep_attributes and instance attributes like a custom default font are
+        kept, so it's cheaper than creating a new PDFTable. cached images not used by the last document are dropped.
+        the next document is the same a new instance with the same fonts would draw.
+
+        :return:
+        """
+        kept = {attribute: getattr(self, attribute) for attribute in self.reset_keep_attributes
+                if hasattr(self, attribute)}
+        # core fonts are added again by set_font if the next document uses them
+        custom_fonts = [font for font in sorted(self.fonts.values(), key=lambda font: font['i'])
+                        if font['type'] == 'TTF']
+        font_files, images = self.font_files, self.images
+        # drop every fpdf document state
+        FPDF.__init__(self)
+        for attribute, value in kept.items():
+            setattr(self, attribute, value)
+        # images whose data was written and dropped by output() can't be reused, and only the images of the last
+        # document are kept, so a pooled instance doesn't keep every image it ever drew
+        self.images = {name: info for name, info in sorted(images.items(), key=lambda item: item[1]['i'])
+                       if 'data' in info and info['usages'] > 0}
+        # fpdf numbers new images after the cached ones, cached images are only embedded if they are used again
+        for i, info in enumerate(self.images.values(), 1):
+            info['i'] = i
+            info['usages'] = 0
+        # a new instance adds the default font in __init__, before the fonts added with add_font
+        default_font = self.font.lower()
+        if any(font['fontkey'] == default_font for font in custom_fonts):
+            self.restore_fonts(custom_fonts, font_files)
+            self.start_document()
+        else:
+            self.start_document()
+            self.restore_fonts(custom_fonts, font_files)
+
+    def restore_fonts(self, fonts: list[dict], font_files: dict[str, dict]):
+        """
+        register again the fonts added with add_font before a reset, numbered in order and with an empty subset,
+        so the glyphs used by the previous document aren't embedded.
+
+        :param fonts: fonts of the previous document, in order
+        :param font_files: font files of the previous document
+        :return:
+        """
+        for font in fonts:
+            fontkey = font['fontkey']
+            self.fonts[fontkey] = dict(font, i=len(self.fonts) + 1, subset=self.create_font_subset())
+            self.font_files[fontkey] = font_files[fontkey]
+
+    def enable_memory_diagnostics(self, every: int = 10, top: int = 10) -> MemoryDiagnostics:
+        """
+        start tracemalloc and sample the memory every some pages, when a page is closed.
+
+        :param every: sample every n pages
+        :param top: number of allocation sites reported
+        :return: MemoryDiagnostics with the samples
+        :raise MismatchValueError: every is smaller than 1
+        """
+        from fpdf_table.memory import MemoryDiagnostics
+        self.memory_diagnostics = MemoryDiagnostics(every, top)
+        self.memory_diagnostics.start()
+        return self.memory_diagnostics
+
+    def memory_usage(self) -> dict[str, int]:
+        """
+        approximate bytes held by every subsystem of the document.
+
+        :return: bytes of page content, fonts, images and layout caches
+        """
+        from fpdf_table.memory import deep_sizeof
+        return {
+            'page_content': sum(len(self.get_page_content(n)) for n in self.pages),
+            'fonts': deep_sizeof(self.fonts) + deep_sizeof(self.font_files),
+            'images': sum(len(info.get('data', b'')) + len(info.get('smask', b'')) for info in self.images.values()),
+            'layout_caches': deep_sizeof(self.text_cache),
+        }
+
+    def get_page_content(self, n: int) -> bytes | bytearray:
+        """
+        content of a page, compressed if the page was released. waits if it's being compressed by a thread.
+
+        :param n: page number
+        :return: content
+        """
+        page = self.pages[n]
+        if not isinstance(page['content'], (bytes, bytearray)):
+            # future of a page compressed by a thread
+            page['content'] = page['content'].result()
+        return page['content']
+
+    def release_page(self, n: int):
+        """
+        compress the content of a closed page to release its buffer, output() writes it as is.
+        pages that contain the total pages alias are kept, the alias is replaced on output.
+        if compression_workers is greater than 0 the page is compressed by a thread.
+
+        :param n: page number
+        :return:
+        """
+        page = self.pages[n]
+        if page.get('compressed') or not self.compress or self._toc_placeholder:
+            return
+        if self.str_alias_nb_pages:
+            for encoding in ('latin-1', 'utf-16-be'):
+                if self.str_alias_nb_pages.encode(encoding) in page['content']:
+                    return
+        if self.compression_workers > 0:
+            # zlib releases the GIL, pages are compressed while the next ones are drawn
+            if self.compression_executor is None:
+                # imported on first use to keep `import fpdf_table` fast
+                from concurrent.futures import ThreadPoolExecutor
+                self.compression_executor = ThreadPoolExecutor(self.compression_workers)
+            page['content'] = self.compression_executor.submit(zlib.compress, page['content'],
+                                                               self.compression_level)
+        else:
+            page['content'] = zlib.compress(page['content'], self.compression_level)
+        page['compressed'] = True
+
+    def restore_page(self, n: int):
+        """
+        decompress the content of a released page, so it can be written again.
+
+        :param n: page number
+        :return:
+        """
+        page = self.pages[n]
+        if page.get('compressed'):
+            page['content'] = bytearray(zlib.decompress(self.get_page_content(n)))
+            page['compressed'] = False
+
+    def _out(self, s):
+        # writing to a previous page with self.page = n, it may be released
+        if self.page != len(self.pages) and self.state == DocumentState.GENERATING_PAGE:
+            self.restore_page(self.page)
+        super()._out(s)
+
+    def _endpage(self):
+        self.draw_grid()
+        super()._endpage()
+        if self.release_closed_pages or self.compression_workers > 0:
+            self.release_page(self.page)
+        if self.memory_diagnostics is not None:
+            self.memory_diagnostics.page_closed(self)
+
+    def _beginpage(self, orientation, format, same, duration, transition, new_page=True):
+        super()._beginpage(orientation, format, same, duration, transition, new_page)
+        # an already released page is written again
+        self.restore_page(self.page)
+
+    def _substitute_page_number(self):
+        # same as fpdf, but released pages don't contain the alias and can't be searched
+        nb = self.pages_count  # total number of pages
+        for encoding in ('utf-16-be', 'latin-1'):
+            alias = self.str_alias_nb_pages.encode(encoding)
+            encoded_nb = str(nb).encode(encoding)
+            for page in self.pages.values():
+                if not page.get('compressed'):
+                    page['content'] = page['content'].replace(alias, encoded_nb)
+
+    def _putpages(self):
+        # same as fpdf, but the content of released pages is already compressed
+        nb = self.pages_count  # total number of pages
+        if self.str_alias_nb_pages:
+            self._substitute_page_number()
+        if self._toc_placeholder:
+            self._insert_table_of_contents()
+        if self.def_orientation == "P":
+            dw_pt = self.dw_pt
+            dh_pt = self.dh_pt
+        else:
+            dw_pt = self.dh_pt
+            dh_pt = self.dw_pt
+        filter = "/Filter /FlateDecode " if self.compress else ""
+        for n in range(1, nb + 1):
+            # Page
+            self._newobj()
+            self._out("<</Type /Page")
+            self._out(f"/Parent {pdf_ref(1)}")
+            page = self.pages[n]
+            if page["duration"]:
+                self._out(f"/Dur {page['duration']}")
+            if page["transition"]:
+                self._out(f"/Trans {page['transition'].dict_as_string()}")
+            w_pt, h_pt = page["w_pt"], page["h_pt"]
+            if w_pt != dw_pt or h_pt != dh_pt:
+                self._out(f"/MediaBox [0 0 {w_pt:.2f} {h_pt:.2f}]")
+            self._out(f"/Resources {pdf_ref(2)}")
+
+            page_annots = self.annots[n]
+            if page_annots:  # Annotations, e.g. links:
+                annots = ""
+                for annot in page_annots:
+                    annots += annot.serialize(self)
+                    if annot.alt_text is not None:
+                        self._add_marked_content(
+                            self.n, struct_type="/Link", alt_text=annot.alt_text
+                        )
+                    if annot.quad_points:
+                        self._set_min_pdf_version("1.6")
+                self._out(f"/Annots [{annots}]")
+            if self.pdf_version > "1.3":
+                self._out("/Group <</Type /Group /S /Transparency /CS /DeviceRGB>>")
+            spid = self._struct_parents_id_per_page.get(self.n)
+            if spid is not None:
+                self._out(f"/StructParents {spid}")
+            self._out(f"/Contents {pdf_ref(self.n + 1)}>>")
+            self._out("endobj")
+
+            # Page content
+            content = self.get_page_content(n)
+            if page.get("compressed"):
+                p = content
+            else:
+                p = zlib.compress(content, self.compression_level) if self.compress else content
+            self._newobj()
+            self._out(f"<<{filter}/Length {len(p)}>>")
+            self._out(pdf_stream(p))
+            self._out("endobj")
+        # Pages root
+        self.offsets[1] = len(self.buffer)
+        self._out("1 0 obj")
+        self._out("<</Type /Pages")
+        self._out(
+            "/Kids ["
+            + " ".join(pdf_ref(object_id_for_page(page)) for page in range(1, nb + 1))
+            + "]"
+        )
+        self._out(f"/Count {nb}")
+        self._out(f"/MediaBox [0 0 {dw_pt:.2f} {dh_pt:.2f}]")
+        self._out(">>")
+        self._out("endobj")
+        # every page was written, stop the compression threads
+        if self.compression_executor is not None:
+            self.compression_executor.shutdown()
+            self.compression_executor = None
+
+    def _putimages(self):
+        if not self.keep_image_data:
+            # fpdf drops the data of every image once it's written
+            super()._putimages()
+            return
+        # keep the image data after output so reset() can reuse the cached images
+        for img_info in sorted(self.images.values(), key=lambda info: info['i']):
+            if img_info['usages'] == 0:
+                continue
+            self._putimage(img_info)
+
     # override multi_cell para cambiar los valores por defectos
     def multi_cell(self, w=0, h: float | None = None, txt="", border=1, align=Align.J, fill=False, split_only=False,
                    link="", ln="DEPRECATED", max_line_height=None, markdown=False, print_sh=False, new_x=XPos.RIGHT,
@@ -58,11 +368,93 @@ class PDFTable(FPDF):
              center="DEPRECATED", markdown=False, new_x=XPos.RIGHT, new_y=YPos.TOP, line_break=False):
         # si se llama con valor, el valor default es el atributo de clase default_cell_height
         h = self.row_height_cell if h is None else h
+        if self.grid_borders and border == 1:
+            if w == 0:
+                w = self.w - self.r_margin - self.x
+            # the border is collected where the cell will be drawn, after a possible page break
+            self._perform_page_break_if_need_be(h)
+            self.add_grid_cell(self.x, self.y, w, h)
+            border = 0
         # llamar a metodo del padre con nuevos argumentos
         super().cell(w, h, txt, border, ln, align, fill, link, center, markdown, new_x, new_y)
         if line_break:
             self.ln()
 
+    def add_grid_cell(self, x: float, y: float, w: float, h: float):
+        """
+        collect the border of a cell, it's drawn by draw_grid with the current draw color and line width.
+
+        :param x: x position
+        :param y: y position
+        :param w: width
+        :param h: height
+        :return:
+        """
+        self.grid_cells.setdefault((self.draw_color, self.line_width), []).append((x, y, w, h))
+
+    def calculate_grid_path(self, cells: list[tuple[float, float, float, float]]) -> str:
+        """
+        make a path with the borders of the cells, shared borders are drawn once and contiguous borders on the
+        same line are merged in one segment.
+
+        :param cells: list of x, y, width and height of every cell
+        :return: path operators, without the stroke operator
+        """
+        k = self.k
+        # segments by line, in points rounded like fpdf writes them, so shared borders have the same key
+        horizontal: dict[float, list[tuple[float, float]]] = {}
+        vertical: dict[float, list[tuple[float, float]]] = {}
+        for x, y, w, h in cells:
+            left, right = round(x * k, 2), round((x + w) * k, 2)
+            top, bottom = round((self.h - y) * k, 2), round((self.h - y - h) * k, 2)
+            horizontal.setdefault(top, []).append((left, right))
+            horizontal.setdefault(bottom, []).append((left, right))
+            vertical.setdefault(left, []).append((bottom, top))
+            vertical.setdefault(right, []).append((bottom, top))
+        path = []
+        for line, segments in horizontal.items():
+            for start, end in self.merge_segments(segments):
+                path.append(f"{start:.2f} {line:.2f} m {end:.2f} {line:.2f} l")
+        for line, segments in vertical.items():
+            for start, end in self.merge_segments(segments):
+                path.append(f"{line:.2f} {start:.2f} m {line:.2f} {end:.2f} l")
+        return ' '.join(path)
+
+    @staticmethod
+    def merge_segments(segments: list[tuple[float, float]]) -> list[tuple[float, float]]:
+        """
+        merge overlapping or touching segments of a line.
+
+        :param segments: list of start and end of every segment
+        :return: merged segments
+        """
+        merged: list[tuple[float, float]] = []
+        for start, end in sorted(segments):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def draw_grid(self):
+        """
+        stroke the borders collected in grid_borders mode as one path per draw color and line width.
+        it's called when a page is closed, call it before drawing over a table in the same page.
+
+        :return:
+        """
+        if not self.grid_cells:
+            return
+        for (draw_color, line_width), cells in self.grid_cells.items():
+            path = self.calculate_grid_path(cells)
+            if draw_color == self.draw_color and line_width == self.line_width:
+                self._out(f"{path} S")
+            else:
+                # the borders were collected with other settings, draw them in a local context
+                self._out(f"q {draw_color.pdf_repr().upper()} {line_width * self.k:.2f} w {path} S Q")
+        self.grid_cells = {}
+
     def get_width_effective(self):
         """
         effective page width: the page width minus its horizontal margins.
@@ -97,6 +489,109 @@ class PDFTable(FPDF):
         self.set_draw_color(220, 220, 220)
         self.set_fill_color(220, 220, 220)
 
+    def get_style_state(self) -> tuple:
+        """
+        fill color, text color and font style, restored with set_cell_style(None, state).
+
+        :return: state
+        """
+        return self.fill_color, self.text_color, self.font_style
+
+    def set_cell_style(self, style: CellStyle | None, state: tuple) -> bool:
+        """
+        set the fill color, text color and font style of a cell over the state of the table, only the values that
+        change are set, so cells with the same style don't write anything to the page.
+
+        :param style: CellStyle or None for the state of the table
+        :param state: state returned by get_style_state
+        :return: True if the cell has to be filled
+        """
+        fill_color, text_color, font_style = state
+        if style is not None:
+            if style.fill_color is not None:
+                fill_color = style.fill_color
+            if style.text_color is not None:
+                text_color = style.text_color
+            if style.font_style is not None:
+                font_style = style.font_style
+        if self.fill_color != fill_color:
+            # like set_fill_color, but the color is already converted
+            self.fill_color = fill_color
+            if self.page > 0:
+                self._out(fill_color.pdf_repr().lower())
+        self.text_color = text_color
+        if self.font_style != font_style:
+            self.set_font(self.font_family, font_style, self.font_size_pt)
+        return style is not None and style.fill_color is not None
+
+    def set_measure_font_style(self, font_style: str):
+        """
+        change the font style of the current family like set_font, but without writing the font to the page, to
+        measure texts with another style. the style of the page has to be set back the same way before drawing.
+
+        :param font_style: font style
+        :return:
+        """
+        # set_font only writes the font when there's a page, the underline is part of the style for set_font
+        page, self.page = self.page, 0
+        try:
+            self.set_font(self.font_family, font_style + ('U' if self.underline else ''), self.font_size_pt)
+        finally:
+            self.page = page
+
+    def add_font(self, family, style="", fname=None, uni="DEPRECATED"):
+        """
+        same as FPDF.add_font, but the font file is parsed only once per process, its metrics are immutable and
+        shared by every document, see fpdf_table.fonts.
+
+        :param family: font family, used by set_font
+        :param style: 'B' for bold, 'I' for italic
+        :param fname: font file
+        :param uni: deprecated, unused
+        :return:
+        """
+        style = ''.join(sorted(style.upper()))
+        fontkey = f'{family.lower()}{style}'
+        extension = os.path.splitext(str(fname))[1] if fname else None
+        # fpdf raises or warns for everything but a new font
+        if extension not in ('.otf', '.otc', '.ttf', '.ttc') or uni != 'DEPRECATED' \
+                or any(letter not in 'BI' for letter in style) or fontkey in self.fonts or fontkey in self.core_fonts:
+            return super().add_font(family, style, fname, uni)
+        for parent in ('.', FPDF_FONT_DIR):
+            if (Path(parent) / fname).exists():
+                font_file = Path(parent) / fname
+                break
+        else:
+            return super().add_font(family, style, fname, uni)
+        metrics = load_font_metrics(font_file)
+        self.fonts[fontkey] = {
+            'i': len(self.fonts) + 1,
+            'type': 'TTF',
+            'name': metrics.name,
+            'desc': metrics.desc,
+            'up': metrics.up,
+            'ut': metrics.ut,
+            'cw': metrics.cw,
+            'ttffile': font_file,
+            'fontkey': fontkey,
+            # the used glyphs are per document
+            'subset': self.create_font_subset(),
+            'min_width': metrics.min_width,
+        }
+        self.font_files[fontkey] = {'length1': metrics.size, 'type': 'TTF', 'ttffile': font_file}
+
+    def create_font_subset(self) -> SubsetMap:
+        """
+        glyph subset of a new TTF font, like fpdf it includes the numbers if there's an alias for the number of
+        pages.
+
+        :return: SubsetMap
+        """
+        subset = '\x00 '
+        if self.str_alias_nb_pages:
+            subset += '0123456789' + self.str_alias_nb_pages
+        return SubsetMap(map(ord, subset))
+
     def add_fonts_custom(self, font_name: str, font_extension: str, font_dir: str = os.path.join(os.getcwd(), 'fonts'),
                          set_default: bool = True):
         """
@@ -285,6 +780,95 @@ class PDFTable(FPDF):
         """
         return (self.l_margin + (self.epw / 2)) - (self.calculate_width_code39(len(text)) / 2)
 
+    def text_cache_key(self, *args) -> tuple | None:
+        """
+        key of the text cache for the given arguments and the current font.
+
+        :param args: kind of measurement, text and the arguments that change the result
+        :return: key or None if the text is too long to be cached
+        """
+        # text_cache_size can be changed at any moment
+        if self.text_cache.maxsize != self.text_cache_size:
+            self.text_cache.resize(self.text_cache_size)
+        if len(args[1]) > self.text_cache_max_length:
+            return None
+        return args + (self.font_family, self.font_style, bool(self.underline))
+
+    def calculate_styled_fragments(self, txt: str, markdown: bool = False) -> tuple:
+        """
+        normalize the text and split it in styled fragments with the current font, repeated texts are cached.
+
+        :param txt: texto
+        :param markdown: markdown
+        :return: styled fragments
+        """
+        key = self.text_cache_key('styled', txt, markdown)
+        styled_text_fragments = None if key is None else self.text_cache.get(key)
+        if styled_text_fragments is None:
+            txt = self.normalize_text(txt)
+            normalized_string = txt.replace("\r", "")
+            styled_text_fragments = self._preload_font_styles(normalized_string, markdown)
+            if key is not None:
+                self.text_cache.set(key, styled_text_fragments)
+        return styled_text_fragments
+
+    def check_text_fits_line(self, w: float, txt: str) -> bool:
+        """
+        check if a text without new lines fits in one line of the given width, measuring its width instead of
+        breaking it in lines.
+
+        :param w: longitud del container.
+        :param txt: texto
+        :return: True if the text is one line
+        """
+        # longitud maxima disponible, self.c_margin es el margen en x
+        maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        # texts longer than a row of the narrowest glyph don't fit, without scanning them
+        if not txt or len(txt) * self.get_min_glyph_width() > maximum_allowed_emwidth:
+            return False
+        # new lines and soft hyphens need the line breaker
+        if '\n' in txt or '\r' in txt or SOFT_HYPHEN in txt:
+            return False
+        # measured like multi_cell, characters the font can't encode raise FPDFUnicodeEncodingException
+        txt = self.normalize_text(txt)
+        return self.get_normalized_string_width_with_style(txt, self.font_style) <= maximum_allowed_emwidth
+
+    def get_min_glyph_width(self) -> float:
+        """
+        width of the narrowest glyph of the current font, in the units of get_normalized_string_width_with_style.
+
+        :return: width, 0 if the font has glyphs without width
+        """
+        key = self.font_family + self.font_style
+        width = self.min_glyph_widths.get(key)
+        if width is None:
+            # fonts added with add_font have it in their shared metrics
+            width = self.current_font.get('min_width')
+            if width is None:
+                widths = self.current_font['cw']
+                # characters without width in the font use MissingWidth
+                width = calculate_min_width(widths.values() if isinstance(widths, dict) else widths,
+                                            self.current_font.get('desc', {}).get('MissingWidth'))
+            self.min_glyph_widths[key] = width
+        return width
+
+    def calculate_text_capacity(self, w: float, row_quantity: int) -> int:
+        """
+        maximum number of characters that can be consumed by the given number of rows, measured with the
+        narrowest glyph of the current font.
+
+        :param w: longitud del container.
+        :param row_quantity: cantidad de filas.
+        :return: number of characters
+        """
+        min_width = self.get_min_glyph_width()
+        if min_width <= 0:
+            return sys.maxsize
+        # longitud maxima disponible, self.c_margin es el margen en x
+        maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        # every row can also consume the space or new line where it's broken
+        return (row_quantity + 1) * (math.floor(maximum_allowed_emwidth / min_width) + 2)
+
     def calculate_text_fragments(self, w=0, txt="", row_quantity=1, justify=True, markdown=False) \
             -> tuple[list[TextLine], bool]:
         """
@@ -304,10 +888,13 @@ class PDFTable(FPDF):
             w = self.w - self.r_margin - self.x
         # longitud maxima disponible, self.c_margin es el margen en x
         maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        # repeated texts are measured once
+        key = self.text_cache_key('fragments', txt, maximum_allowed_emwidth, row_quantity, justify, markdown)
+        cached = None if key is None else self.text_cache.get(key)
+        if cached is not None:
+            return list(cached[0]), cached[1]
         # Calculate text length
-        txt = self.normalize_text(txt)
-        normalized_string = txt.replace("\r", "")
-        styled_text_fragments = self._preload_font_styles(normalized_string, markdown)
+        styled_text_fragments = self.calculate_styled_fragments(txt, markdown)
         # text in lines
         text_lines = []
         multi_line_break = MultiLineBreak(
@@ -328,9 +915,11 @@ class PDFTable(FPDF):
         # if text is larger than container and has to divide, if text_line has more content
         # it means that the text is larger
         text_is_larger = True if text_line is not None else False
+        if key is not None:
+            self.text_cache.set(key, (tuple(text_lines), text_is_larger))
         return text_lines, text_is_larger
 
-    def calculate_text_rows(self, w: float = 0, txt="", justify=True, markdown=False):
+    def calculate_text_rows(self, w: float = 0, txt="", justify=True, markdown=False, max_rows: int | None = None):
         """
         calculate how many rows will take the given text in the given width.
 
@@ -338,18 +927,25 @@ class PDFTable(FPDF):
         :param txt: texto
         :param justify: justify
         :param markdown: markdown
+        :param max_rows: stop counting when this amount of rows is reached, the result is at most max_rows
         :return:
         """
         # If width is 0, set width to available width between margins
         # Si la longitud 0 , setear width al disponible restando margenes
         if w == 0:
             w = self.w - self.r_margin - self.x
+        # short texts like ids, dates or amounts are one row
+        if not markdown and (max_rows is None or max_rows > 0) and self.check_text_fits_line(w, txt):
+            return 1
         # longitud maxima disponible, self.c_margin es el margen en x
         maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        # repeated texts are measured once
+        key = self.text_cache_key('rows', txt, maximum_allowed_emwidth, justify, markdown, max_rows)
+        cached = None if key is None else self.text_cache.get(key)
+        if cached is not None:
+            return cached
         # Calculate text length
-        txt = self.normalize_text(txt)
-        normalized_string = txt.replace("\r", "")
-        styled_text_fragments = self._preload_font_styles(normalized_string, markdown)
+        styled_text_fragments = self.calculate_styled_fragments(txt, markdown)
         # text in lines
         text_lines = []
         multi_line_break = MultiLineBreak(
@@ -358,52 +954,181 @@ class PDFTable(FPDF):
             justify=justify,
         )
         text_line = multi_line_break.get_line_of_given_width(maximum_allowed_emwidth)
-        # calcular cantidad de filas
+        # calcular cantidad de filas, cortar el while al llegar a max_rows
         row_count = 0
-        while text_line is not None:
+        while text_line is not None and (max_rows is None or row_count < max_rows):
             text_lines.append(text_line)
             text_line = multi_line_break.get_line_of_given_width(
                 maximum_allowed_emwidth
             )
             row_count += 1
+        if key is not None:
+            self.text_cache.set(key, row_count)
         return row_count
 
+    def calculate_text_split(self, w: float, txt: str, row_quantity: int, justify: bool = True) \
+            -> tuple[tuple[TextLine, ...], tuple[int, ...], int | None]:
+        """
+        break a text in lines like calculate_text_fragments, and find where every line starts in the text and where
+        the text that doesn't fit starts, from the characters consumed by the line breaker.
+
+        :param w: longitud del container.
+        :param txt: texto sin retornos de carro
+        :param row_quantity: cantidad de filas.
+        :param justify: justificar texto.
+        :return: lines, index of the first character of every line and index of the first character that doesn't
+            fit, or None if the whole text fits
+        """
+        # longitud maxima disponible, self.c_margin es el margen en x
+        maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        # repeated texts are measured once
+        key = self.text_cache_key('split', txt, maximum_allowed_emwidth, row_quantity, justify)
+        cached = None if key is None else self.text_cache.get(key)
+        if cached is not None:
+            return cached
+        styled_text_fragments = self.calculate_styled_fragments(txt)
+        multi_line_break = MultiLineBreak(
+            styled_text_fragments,
+            self.get_normalized_string_width_with_style,
+            justify=justify,
+        )
+
+        def position() -> int:
+            # normalize_text keeps one character per character, so the breaker position is an index of txt
+            return sum(len(fragment.characters) for fragment in
+                       styled_text_fragments[:multi_line_break.fragment_index]) + multi_line_break.character_index
+
+        text_lines = []
+        line_starts = []
+        while len(text_lines) < row_quantity:
+            line_start = position()
+            text_line = multi_line_break.get_line_of_given_width(maximum_allowed_emwidth)
+            if text_line is None:
+                break
+            text_lines.append(text_line)
+            line_starts.append(line_start)
+        split = position()
+        # the text is larger if the breaker returns another line
+        if len(text_lines) < row_quantity or multi_line_break.get_line_of_given_width(maximum_allowed_emwidth) is None:
+            split = None
+        result = (tuple(text_lines), tuple(line_starts), split)
+        if key is not None:
+            self.text_cache.set(key, result)
+        return result
+
+    def calculate_ellipsis_cut(self, txt: str, line_starts: tuple[int, ...], end: int, w: float) -> int:
+        """
+        position where a truncated text is cut to add an ellipsis. the last word is replaced by the ellipsis, a word
+        longer than the last line, i.e. an url or a hash, is cut at the last character that leaves room for it. line
+        breaks are kept.
+
+        :param txt: texto sin retornos de carro
+        :param line_starts: index of the first character of every line, see calculate_text_split
+        :param end: index of the first character that doesn't fit
+        :param w: longitud del container.
+        :return: index of the first character replaced by the ellipsis
+        """
+        # longitud maxima disponible, self.c_margin es el margen en x
+        maximum_allowed_emwidth = (w - 2 * self.c_margin) * 1000 / self.font_size
+        visible = txt[:end].rstrip()
+        words = visible.rsplit(None, 1)
+        cut = len(visible) - len(words[-1]) if len(words) == 2 else 0
+        if cut < line_starts[-1]:
+            cut = len(visible)
+        # the line where the ellipsis is drawn must have room for it
+        while cut > 0:
+            line_start = max(start for start in line_starts if start <= cut)
+            if self.get_normalized_string_width_with_style(self.normalize_text(txt[line_start:cut] + '...'),
+                                                           self.font_style) <= maximum_allowed_emwidth:
+                break
+            cut -= 1
+        return cut
+
     def fit_text_fixed_height(self, txt: str, row_height: float, container_width: float, container_height: float,
                               linesep: str = '\n', ellipsis: bool = False) -> tuple[str, str]:
         """
         divide the text in two string, the first string contains the piece of text that fits in the container,
-        the second string contains the remaining text that doesn't it.
+        the second string contains the remaining text that doesn't it. the text is split where the line breaker
+        stopped, so words longer than the container and new lines are kept as they are.
 
         :param container_width: width of the container
         :param txt: text
         :param row_height: height of every row
         :param container_height: total height of the container
-        :param linesep: os new line representation
+        :param linesep: unused, kept for compatibility
         :return: list with two strings
         :param ellipsis: truncate text and add ellipsis
         """
+        text_that_fits, text_overflow, _ = self.calculate_text_fit(txt, row_height, container_width,
+                                                                   container_height, ellipsis)
+        return text_that_fits, text_overflow
+
+    def calculate_text_fit(self, txt: str, row_height: float, container_width: float, container_height: float,
+                           ellipsis: bool = False) -> tuple[str, str, tuple[TextLine, ...] | None]:
+        """
+        same as fit_text_fixed_height, but also returns the lines the text that fits is broken in, so it can be drawn
+        without breaking it again.
+
+        :param txt: text
+        :param row_height: height of every row
+        :param container_width: width of the container
+        :param container_height: total height of the container
+        :param ellipsis: truncate text and add ellipsis
+        :return: text that fits, text that doesn't fit and the lines of the text that fits, or None if the lines
+            are not known, i.e. the text fits in one line or the ellipsis was added
+        """
         # cantidad de filas disponibles, redondeo hacia abajo de la division y del width
         row_count: int = math.floor(container_height / row_height)
         container_width: int = math.floor(container_width)
         # if text is empty, return two empty strings
         if not txt:
-            return '', ''
-        # en fragments se encuentra la porcion de texto que entra en el container, pero el texto esta deconstruido
-        # fragments es una lista de array de caracteres [['a','b'],['c']]
-        # cada array de caracteres representa una fila y la cantidad de arrays son la cantidad de filas
-        # ver objeto TextLine y Fragment
-        fragments, text_is_larger = self.calculate_text_fragments(container_width, txt, row_count)
-        # si la cantidad de fragmentos (filas) es menor o igual a la cantidad de filas disponibles,
-        # entonces no se necesita calcular nada, ya que el texto entero entra en el container
+            return '', '', None
+        # nothing fits in a container smaller than a row
+        if row_count < 1:
+            return '', txt, None
+        # if the text is one line it fits entirely
+        if self.check_text_fits_line(container_width, txt):
+            return txt, '', None
+        # only a prefix of the text can be shown, so only a prefix long enough to fill the container is broken in
+        # lines. if the prefix doesn't fill the container the remaining text may fit too, then try a larger prefix
+        prefix_length = self.calculate_text_capacity(container_width, row_count)
+        while True:
+            # multi_cell removes the carriage returns too
+            text = txt[:prefix_length].replace('\r', '')
+            text_lines, line_starts, split = self.calculate_text_split(container_width, text, row_count)
+            # lines with only whitespace after the container are not lost
+            text_is_larger = split is not None and bool(text[split:].strip())
+            if text_is_larger or prefix_length >= len(txt):
+                break
+            prefix_length *= 2
+        # el texto entero entra en el container
+        if split is None:
+            return txt, '', text_lines
         if not text_is_larger:
-            return txt, ''
-        # reconstruir los fragmentos en el texto que entra en el container
+            return text[:split].rstrip(), '', text_lines
+        if ellipsis:
+            cut = self.calculate_ellipsis_cut(text, line_starts, split, container_width)
+            # the replaced word goes to the text that doesn't fit
+            return text[:cut] + '...', (text[cut:] + txt[prefix_length:]).lstrip(), None
+        # remove whitespace, new line or tab present at the start of the remaining text
+        return text[:split].rstrip(), (text[split:] + txt[prefix_length:]).lstrip(), text_lines
+
+    @staticmethod
+    def join_text_lines(text_lines: list[TextLine], linesep: str = '\n') -> str:
+        """
+        rebuild the text of a list of TextLine, lines are joined with a space or with linesep if the line ends with
+        a new line.
+
+        :param text_lines: lines returned by MultiLineBreak
+        :param linesep: os new line representation
+        :return: text
+        """
         join_text = ''
-        for text in fragments:
+        for text in text_lines:
             #  if the fragment object is empty means the row is a new line, doesn't have text
-            if text.fragments:
+            for fragment in text.fragments:
                 # por cada fila juntar los caracteres para tener una lista de strings [['ab'],['c']
-                join_text += ''.join(text.fragments[0].characters)
+                join_text += ''.join(fragment.characters)
             # para juntar dos filas se pone un espacio o salto de linea
             if text.trailing_nl:
                 # join_text += os.linesep
@@ -412,40 +1137,46 @@ class PDFTable(FPDF):
                 join_text += ' '
         # quitar el ultimo espacio agregado, el resultado es ['ab c']
         # remove trailing new line
-        join_text = join_text.rstrip()
-        # dividir el texto por un separador que es join_text, sea txt = ['ab c de'] y join_text = ['ab c']
-        # el resultado de split es ['', 'de'], esto porque el split remueve la clave separadora y separa el texto
-        # antes de la clave y despues de la clave, en este caso como antes de la clave no hay nada entonces en
-        # la primera parte no hay nada y en la segunda parte se encuentra el resto del texto
-        split_text = txt.split(join_text, maxsplit=1)
-        try:
-            # agregar la clave separadora a la primera parte de la lista,
-            split_text[0] = join_text
-            # remove whitespace, new line or tab present at start of the string
-            split_text[1] = split_text[1].lstrip()
-            # calculate ellipsis
-            if ellipsis and text_is_larger:
-                # split the whole first string by whitespaces, then remove last part ( last word),
-                # finally join again the parts with whitespaces and concatenate ellipsis
-                split = split_text[0].split(' ')
-                last_word = split[-1]
-                # if last word have less than 3 characters
-                if len(last_word) >= 3:
-                    split_text[0] = ' '.join(split[:-1]) + ' ' + '...'
-                else:
-                    # add backlash instead of dots
-                    backslash_quantity = '\\' * len(last_word)
-                    split_text[0] = ' '.join(split[:-1]) + ' ' + backslash_quantity
-                # add removed word to the second string
-                split_text[1] = last_word + ' ' + split_text[1]
-            # resultado ['ab c',' de']
-            return split_text[0], split_text[1]
-        except IndexError:
-            # if error is find here means that probably split_text doesn't have 2 elements.
-            # i.e. split_text[1] doesn't exist
-            # probably is caused by os specific new line, i.e. windows = \r\n, unix = \n
-            # throw custom error
-            raise SplitTextError
+        return join_text.rstrip()
+
+    def draw_text_lines(self, w: float, h: float, txt: str, text_lines: Sequence[TextLine] | None,
+                        align: str | Align = Align.J):
+        """
+        draw a text already broken in lines like multi_cell without border, the cursor goes back to the position of
+        the first line. the text is drawn with multi_cell when the lines are not known or the text doesn't end with
+        the last line, i.e. the line ends with spaces or a hyphen that are not in the text.
+
+        :param w: width of the lines
+        :param h: height of every line
+        :param txt: text of the lines
+        :param text_lines: lines returned by calculate_text_fit or None
+        :param align: alignment
+        :return:
+        """
+        align = Align.coerce(align)
+        last_text = ''.join(''.join(fragment.characters) for fragment in text_lines[-1].fragments) \
+            if text_lines else ''
+        if not last_text or not txt.endswith(last_text) or align == Align.X:
+            self.multi_cell(w=w, h=h, txt=txt, border=0, new_x=XPos.LEFT, new_y=YPos.TOP, align=align)
+            return
+        prev_y = self.y
+        for text_line_index, text_line in enumerate(text_lines):
+            is_last_line = text_line_index == len(text_lines) - 1
+            # multi_cell draws the last line of a justified text aligned to the left, and only justifies with J
+            if text_line.justify and (is_last_line or align != Align.J):
+                text_line = text_line._replace(justify=False)
+            new_page = self._render_styled_text_line(
+                text_line,
+                w,
+                h=h,
+                border='',
+                new_x=XPos.LEFT,
+                new_y=YPos.TOP if is_last_line else YPos.NEXT,
+                align=Align.L if (align == Align.J and is_last_line) else align,
+            )
+            if is_last_line and new_page:
+                prev_y = self.y
+        self.y = prev_y
 
     def cell_fixed(self, container_width: float, container_height: float, txt: str = '', align=Align.L,
                    line_break: bool = False, inline: bool = False):
@@ -479,9 +1210,45 @@ class PDFTable(FPDF):
         if line_break:
             self.ln()
 
+    def draw_container(self, container_width: float, container_height: float, line_break: bool = False,
+                       inline: bool = False):
+        """
+        draw the border of a fixed size container at the current position and move the cursor like cell_fixed,
+        but with a single rectangle and no positioning cells. if the container or the cursor movement triggers a
+        page break it uses cell_fixed, so the output is the same.
+
+        :param container_width: container_width
+        :param container_height: container_height
+        :param line_break: perform a new line
+        :param inline: next Y with be in the same line
+        :return:
+        """
+        # cell_fixed positioning cell has height row_height_cell and is drawn under the border if not inline
+        height = max(container_height, self.row_height_cell) if inline \
+            else container_height + self.row_height_cell
+        if self.will_page_break(height):
+            self.cell_fixed(container_width, container_height, line_break=line_break, inline=inline)
+            return
+        x, y = self.x, self.y
+        if self.grid_borders:
+            self.add_grid_cell(x, y, container_width, container_height)
+        else:
+            self.rect(x, y, container_width, container_height)
+        # self.ln() defaults to last cell height
+        self.lasth = self.row_height_cell
+        if inline:
+            # next position is right top
+            self.x = x + container_width
+        else:
+            # next position is left margin under the border
+            self.x = self.l_margin
+            self.y = y + container_height
+        if line_break:
+            self.ln()
+
     def multi_cell_fixed(self, w: float, txt: str, row_height: float, container_height: float,
                          align: str | Align = Align.J,
-                         line_break: bool = False, ellipsis: bool = False, inline: bool = False):
+                         line_break: bool = False, ellipsis: bool = False, inline: bool = False, fill: bool = False):
         """
         draw a fixed size cell, if the text is larger than the cell ( container ), it will draw the text until it fits
         and will return the text that doesn't fit for later use.
@@ -494,21 +1261,65 @@ class PDFTable(FPDF):
         :param line_break: add a trailing new line
         :param ellipsis: truncate text and add ellipsis
         :param inline: next Y with be in the same line
+        :param fill: paint the background of the container with the fill color
         :return:
         """
         # calculate text truncation ( division)
-        try:
-            text_that_fits, text_overflow = self.fit_text_fixed_height(txt, row_height, w, container_height,
-                                                                       ellipsis=ellipsis)
-        except SplitTextError:
-            # if there's a custom error call again with different line separator
-            text_that_fits, text_overflow = self.fit_text_fixed_height(txt, row_height, w, container_height, '\r\n',
-                                                                       ellipsis)
+        text_that_fits, text_overflow, text_lines = self.calculate_text_fit(txt, row_height, w, container_height,
+                                                                            ellipsis)
+        if fill:
+            # the background goes under the text, in the page where the container is drawn
+            self._perform_page_break_if_need_be(container_height)
+            self.rect(self.x, self.y, w, container_height, style='F')
+        # draw text without border, with the lines it was already broken in
+        self.draw_text_lines(w, row_height, text_that_fits, text_lines, align)
+        # draw border and fix self.ln()
+        self.draw_container(w, container_height, line_break=line_break, inline=inline)
+        return text_overflow
+
+    def text_flow(self, txt: str, justify: bool = True, markdown: bool = False) -> TextFlow:
+        """
+        create a TextFlow with the current font, to draw a text through many fixed containers with multi_cell_flow.
+
+        :param txt: text
+        :param justify: justify text
+        :param markdown: markdown
+        :return: TextFlow
+        """
+        return TextFlow(self, txt, justify, markdown)
+
+    def multi_cell_flow(self, w: float, flow: str | TextFlow, row_height: float, container_height: float,
+                        align: str | Align = Align.J, line_break: bool = False, inline: bool = False) -> TextFlow:
+        """
+        draw a fixed size cell like multi_cell_fixed, but instead of returning the text that doesn't fit returns a
+        TextFlow that remembers where the text was cut. pass it again to draw the rest of the text in the next
+        container, even on another page, without breaking the already drawn text again. check TextFlow.finished
+        to know if there's text left.
+
+        :param w: container width
+        :param flow: text or a TextFlow returned by a previous call
+        :param row_height: height of every row
+        :param container_height: total height of the container
+        :param align: alignment
+        :param line_break: add a trailing new line
+        :param inline: next Y with be in the same line
+        :return: TextFlow
+        """
+        if not isinstance(flow, TextFlow):
+            flow = self.text_flow(flow, justify=Align.coerce(align) == Align.J)
+        row_count: int = math.floor(container_height / row_height)
+        # measure and draw with the font the flow was created with, i.e. a header in a new page changes the font
+        current_font = (self.font_family, self.font_style, self.font_size_pt)
+        if current_font != flow.font:
+            self.set_font(*flow.font)
+        text_that_fits = self.join_text_lines(flow.next_lines(self, w, row_count))
         # draw text without border
         self.multi_cell(w=w, h=row_height, txt=text_that_fits, border=0, new_x=XPos.LEFT, new_y=YPos.TOP, align=align)
         # draw border and fix self.ln()
-        self.cell_fixed(w, container_height, line_break=line_break, inline=inline)
-        return text_overflow
+        self.draw_container(w, container_height, line_break=line_break, inline=inline)
+        if current_font != flow.font:
+            self.set_font(*current_font)
+        return flow
 
     def calculate_width_list(self, width_list: list[float], columns_count: int) -> list[float]:
         """
@@ -560,89 +1371,250 @@ class PDFTable(FPDF):
                 align_list = [default_value] * columns_count
             return align_list
 
-    def draw_row_line(self, text_list: list[str], width_list: list[float], align: Align | list[Align],
-                      line_break: bool = False):
+    def calculate_columns(self, width_list: list[float] | TableSpec, align: Align | list[Align], columns_count: int,
+                          default_value: Align = Align.J) -> tuple[list[float] | tuple[float, ...],
+                                                                   list[Align] | tuple[Align, ...]]:
+        """
+        resolve the widths and alignments of a row. if width_list is a TableSpec its precomputed widths and
+        alignments are used as they are, otherwise they are calculated with calculate_width_list and
+        calculate_align_list.
+
+        :param width_list: list of width for every column or a TableSpec
+        :param align: list of alignment or one alignment value, ignored if width_list is a TableSpec
+        :param columns_count: columns count
+        :param default_value: if align is an empty list use align passed here
+        :return: widths and alignments
+        :raise NumberElementsListMismatchError: columns count doesn't match the TableSpec columns
+        """
+        if isinstance(width_list, TableSpec):
+            if len(width_list.widths) != columns_count:
+                raise NumberElementsListMismatchError
+            return width_list.widths, width_list.aligns
+        return (self.calculate_width_list(width_list, columns_count),
+                self.calculate_align_list(align, columns_count, default_value))
+
+    def table_spec(self, *args: float, width_list: list[float] | None = None, align: Align | list[Align] = Align.L) \
+            -> TableSpec:
+        """
+        build a reusable TableSpec, widths are given like table_cols (bootstrap grid units) or in mm with width_list.
+        the spec is validated once against the effective page width, so it can be passed to table_header and
+        table_row as width_list without calculating the widths and alignments on every call.
+
+        :param args: bootstrap column widths
+        :param width_list: list of width´s in mm, used if args is empty
+        :param align: list of alignment or one alignment value
+        :return: TableSpec
+        :raise MismatchValueError: a bootstrap column width is not positive
+        :raise MissingValueError: neither args nor width_list were given
+        :raise WidthOverflowError: total width doesn't fit in the effective page width
+        """
+        if args:
+            width_list = self.table_cols(*args)
+            if not width_list:
+                raise MismatchValueError
+        elif not width_list:
+            raise MissingValueError
+        align_list = self.calculate_align_list(align, len(width_list), Align.L)
+        return TableSpec(width_list, align_list, self.epw)
+
+    def draw_row_line(self, text_list: list[str], width_list: list[float] | TableSpec, align: Align | list[Align],
+                      line_break: bool = False, cell_styles: Sequence[CellStyle | None] | None = None):
         """
         draw n columns in the same row, columns height are 1 column.
 
         :param text_list: list of the texts to write
-        :param width_list: list of width for every column
+        :param width_list: list of width for every column or a TableSpec
         :param line_break: perform a line break
         :param align: alignment
+        :param cell_styles: style of every cell, see TableStyle
         :return:
         """
         columns_count: int = len(text_list)
         # check width_list
-        width_list = self.calculate_width_list(width_list, columns_count)
-        align_list = self.calculate_align_list(align, columns_count, Align.L)
+        width_list, align_list = self.calculate_columns(width_list, align, columns_count, Align.L)
+        state = self.get_style_state() if cell_styles else None
+        fill = False
         # draw n-1 cells inline
         for i in range(columns_count - 1):
+            if cell_styles:
+                fill = self.set_cell_style(cell_styles[i], state)
             # draw cell
-            self.cell(w=width_list[i], txt=text_list[i], align=align_list[i])
+            self.cell(w=width_list[i], txt=text_list[i], align=align_list[i], fill=fill)
+        if cell_styles:
+            fill = self.set_cell_style(cell_styles[-1], state)
         # perform an extra line break if desired
-        self.cell(w=width_list[-1], txt=text_list[-1], align=align_list[-1], line_break=line_break)
+        self.cell(w=width_list[-1], txt=text_list[-1], align=align_list[-1], fill=fill, line_break=line_break)
         self.ln()
+        if cell_styles:
+            self.set_cell_style(None, state)
 
-    def draw_row_fixed(self, text_list: list[str], width_list: list[float], align: Align | list[Align],
-                       fixed_height: float = None, line_break: bool = False):
+    def draw_row_fixed(self, text_list: list[str], width_list: list[float] | TableSpec, align: Align | list[Align],
+                       fixed_height: float = None, line_break: bool = False,
+                       cell_styles: Sequence[CellStyle | None] | None = None):
         """
         draw n columns in the same row, columns height is fixed.
 
         :param text_list: list of the texts to write
-        :param width_list: list of width for every column
+        :param width_list: list of width for every column or a TableSpec
         :param fixed_height: height of every column
         :param line_break: perform a line break
         :param align: alignment
+        :param cell_styles: style of every cell, see TableStyle
         :return:
         """
         columns_count: int = len(text_list)
         # check width_list
-        width_list = self.calculate_width_list(width_list, columns_count)
-        align_list = self.calculate_align_list(align, columns_count)
+        width_list, align_list = self.calculate_columns(width_list, align, columns_count)
+        state = self.get_style_state() if cell_styles else None
+        fill = False
         # draw n-1 fixed multi_cells inline
         for i in range(columns_count - 1):
+            if cell_styles:
+                fill = self.set_cell_style(cell_styles[i], state)
             # container height for every cell is fixed
             self.multi_cell_fixed(w=width_list[i], txt=text_list[i], row_height=self.row_height_multi_cell,
-                                  container_height=fixed_height, align=align_list[i], inline=True)
+                                  container_height=fixed_height, align=align_list[i], inline=True, fill=fill)
+        if cell_styles:
+            fill = self.set_cell_style(cell_styles[-1], state)
         # last cell doesn't have to be inline ir order to leave the cursor under the cells, line break is optional
         self.multi_cell_fixed(w=width_list[-1], txt=text_list[-1], row_height=self.row_height_multi_cell,
-                              container_height=fixed_height, align=align_list[-1], line_break=line_break)
+                              container_height=fixed_height, align=align_list[-1], line_break=line_break, fill=fill)
+        if cell_styles:
+            self.set_cell_style(None, state)
 
-    def draw_row_responsive(self, text_list: list[str], width_list: list[float], align: Align | list[Align],
-                            line_break: bool = False):
+    def draw_row_responsive(self, text_list: list[str], width_list: list[float] | TableSpec, align: Align | list[Align],
+                            line_break: bool = False, max_rows: int | None = None, max_height: float | None = None,
+                            cell_styles: Sequence[CellStyle | None] | None = None):
         """
         draw n columns in the same row, every column has height equals to the column with maximum height.
 
+        if max_rows or max_height are given the height of the row is capped, text measurement stops at the cap and
+        the cells that don't fit are truncated with ellipsis.
+
         :param text_list: list of the texts to write
-        :param width_list: list of width for every column
+        :param width_list: list of width for every column or a TableSpec
         :param line_break: perform a line break
         :param align: alignment
+        :param max_rows: maximum number of rows of the row
+        :param max_height: maximum height of the row
+        :param cell_styles: style of every cell, see TableStyle
         :return:
+        :raise HeightError: max_rows or max_height don't allow at least one row
         """
         columns_count: int = len(text_list)
         # check width_list
-        width_list = self.calculate_width_list(width_list, columns_count)
-        align_list = self.calculate_align_list(align, columns_count)
+        width_list, align_list = self.calculate_columns(width_list, align, columns_count)
+        # merge both caps into a maximum number of rows
+        row_cap = self.calculate_row_cap(max_rows, max_height)
         # calculate maximum number of rows, so every cell will have the same amount of rows
-        max_rows: int = 0
-        for i in range(columns_count):
-            # calculate row count for cell i
-            justify = True if align_list[i] == Align.J else False
-            row_count = self.calculate_text_rows(w=width_list[i], txt=text_list[i], justify=justify)
-            # save max
-            if row_count > max_rows:
-                max_rows = row_count
+        row_quantity = self.calculate_responsive_rows(text_list, width_list, align_list, row_cap, cell_styles)
+        # truncate only if there is a cap, cells that fit are drawn as they are
+        ellipsis = row_cap is not None
+        state = self.get_style_state() if cell_styles else None
+        fill = False
         # draw n-1 cells inline
         for i in range(columns_count - 1):
+            if cell_styles:
+                fill = self.set_cell_style(cell_styles[i], state)
             # container height for every cell will be the maximum height, that is,
             # maximum number of rows * height of every row
             self.multi_cell_fixed(w=width_list[i], txt=text_list[i], row_height=self.row_height_multi_cell,
-                                  container_height=max_rows * self.row_height_multi_cell, align=align_list[i],
-                                  inline=True)
+                                  container_height=row_quantity * self.row_height_multi_cell, align=align_list[i],
+                                  inline=True, ellipsis=ellipsis, fill=fill)
+        if cell_styles:
+            fill = self.set_cell_style(cell_styles[-1], state)
         # last cell doesn't have to be inline ir order to leave the cursor under the cells, line break is optional
         self.multi_cell_fixed(w=width_list[-1], txt=text_list[-1], row_height=self.row_height_multi_cell,
-                              container_height=max_rows * self.row_height_multi_cell, align=align_list[-1],
-                              line_break=line_break)
+                              container_height=row_quantity * self.row_height_multi_cell, align=align_list[-1],
+                              line_break=line_break, ellipsis=ellipsis, fill=fill)
+        if cell_styles:
+            self.set_cell_style(None, state)
+
+    def calculate_responsive_rows(self, text_list: list[str], width_list: list[float] | tuple[float, ...],
+                                  align_list: list[Align] | tuple[Align, ...], row_cap: int | None = None,
+                                  cell_styles: Sequence[CellStyle | None] | None = None) -> int:
+        """
+        calculate the number of rows of a responsive row, that is the rows of the cell with more rows.
+
+        :param text_list: list of the texts to write
+        :param width_list: list of width for every column
+        :param align_list: list of alignment for every column
+        :param row_cap: stop when this number of rows is reached
+        :param cell_styles: style of every cell, cells are measured with their font style
+        :return: number of rows
+        """
+        font_style = self.font_style
+        row_quantity: int = 0
+        for i in range(len(text_list)):
+            if cell_styles:
+                style = cell_styles[i]
+                cell_font_style = font_style if style is None or style.font_style is None else style.font_style
+                if self.font_style != cell_font_style:
+                    self.set_measure_font_style(cell_font_style)
+            # calculate row count for cell i
+            justify = True if align_list[i] == Align.J else False
+            row_count = self.calculate_text_rows(w=width_list[i], txt=text_list[i], justify=justify,
+                                                 max_rows=row_cap)
+            # save max
+            if row_count > row_quantity:
+                row_quantity = row_count
+            # the cap was reached, the remaining cells can't make the row higher
+            if row_cap is not None and row_quantity >= row_cap:
+                break
+        if cell_styles and self.font_style != font_style:
+            self.set_measure_font_style(font_style)
+        return row_quantity
+
+    def calculate_row_height(self, text_list: list[str], width_list: list[float] | TableSpec = [],
+                             align: list[Align] | Align = Align.L, option: str = 'line',
+                             fixed_height: float = None, max_rows: int | None = None,
+                             max_height: float | None = None,
+                             cell_styles: Sequence[CellStyle | None] | None = None) -> float:
+        """
+        calculate the height of a row drawn by table_row with the same arguments, without drawing it.
+
+        :param text_list: list of the texts to write
+        :param width_list: list of width´s for every column or a TableSpec
+        :param align: alignment
+        :param option: define what type of row to draw
+        :param fixed_height: height if option is fixed
+        :param max_rows: maximum number of rows if option is responsive
+        :param max_height: maximum height if option is responsive
+        :param cell_styles: style of every cell, see TableStyle
+        :return: height
+        :raise MissingValueError: a value was expected and wasn't found
+        :raise MismatchValueError: undefined option
+        """
+        if option == 'line':
+            return self.row_height_cell
+        elif option == 'fixed':
+            if not fixed_height:
+                raise MissingValueError
+            return fixed_height
+        elif option == 'responsive':
+            width_list, align_list = self.calculate_columns(width_list, align, len(text_list))
+            row_cap = self.calculate_row_cap(max_rows, max_height)
+            return self.calculate_responsive_rows(text_list, width_list, align_list, row_cap, cell_styles) * \
+                self.row_height_multi_cell
+        else:
+            raise MismatchValueError
+
+    def calculate_row_cap(self, max_rows: int | None = None, max_height: float | None = None) -> int | None:
+        """
+        merge a maximum number of rows and a maximum height into a maximum number of rows.
+
+        :param max_rows: maximum number of rows
+        :param max_height: maximum height, converted to rows of height row_height_multi_cell
+        :return: maximum number of rows or None if there's no cap
+        :raise HeightError: the cap doesn't allow at least one row
+        """
+        row_cap = max_rows
+        if max_height is not None:
+            height_rows = math.floor(max_height / self.row_height_multi_cell)
+            row_cap = height_rows if row_cap is None else min(row_cap, height_rows)
+        if row_cap is not None and row_cap < 1:
+            raise HeightError
+        return row_cap
 
     def draw_image_center(self, img: any, x: float = None, y: float = None, img_width: float = 0, img_height: float = 0,
                           container_width: float = None, container_height: float = None):
@@ -684,20 +1656,19 @@ class PDFTable(FPDF):
                                                        element_length=img_height),
                        w=img_width, h=img_height)
 
-    def table_header(self, text_list: list[str], width_list: list[float] = [], align: list[Align] | Align = Align.L,
-                     fill: bool = True, border: int = 1):
+    def table_header(self, text_list: list[str], width_list: list[float] | TableSpec = [],
+                     align: list[Align] | Align = Align.L, fill: bool = True, border: int = 1):
         """
         draw a table header for a table.
 
         :param text_list: list of the texts to write
-        :param width_list: list of width´s for every column
+        :param width_list: list of width´s for every column or a TableSpec, a TableSpec also sets the alignments
         :param align: alignment
         :return:
         """
         columns_count: int = len(text_list)
         # if width_list is string, convert to empty list
-        width_list = self.calculate_width_list(width_list, columns_count)
-        align_list = self.calculate_align_list(align, columns_count, Align.C)
+        width_list, align_list = self.calculate_columns(width_list, align, columns_count, Align.C)
         # set font
         self.set_font(self.font, 'B', self.text_title_size)
         # draw n-1 cells inline
@@ -709,16 +1680,21 @@ class PDFTable(FPDF):
         # default font
         self.set_font(self.font, '', self.text_normal_size)
 
-    def table_row(self, text_list: list[str], width_list: list[float] = [], align: list[Align] | Align = Align.L,
-                  option: str = 'line', fixed_height: float = None):
+    def table_row(self, text_list: list[str], width_list: list[float] | TableSpec = [],
+                  align: list[Align] | Align = Align.L, option: str = 'line', fixed_height: float = None,
+                  max_rows: int | None = None, max_height: float | None = None,
+                  cell_styles: Sequence[CellStyle | None] | None = None):
         """
         draw a row for a table.
 
         :param text_list: list of the texts to write
-        :param width_list: list of width´s for every column
+        :param width_list: list of width´s for every column or a TableSpec, a TableSpec also sets the alignments
         :param option: define what type of row to draw
         :param fixed_height: height if option is fixed
         :param align: alignment
+        :param max_rows: maximum number of rows if option is responsive, larger texts are truncated
+        :param max_height: maximum height if option is responsive, larger texts are truncated
+        :param cell_styles: style of every cell, i.e. a row of TableStyle.calculate_styles
         :return:
         :raise MissingValueError: a value was expected and wasn't found
         :raise HeightError: height cannot be smaller than default cell height
@@ -726,18 +1702,118 @@ class PDFTable(FPDF):
         """
 
         if option == 'line':
-            self.draw_row_line(text_list, width_list, align, False)
+            self.draw_row_line(text_list, width_list, align, False, cell_styles)
         elif option == 'fixed':
             if not fixed_height:
                 raise MissingValueError
             if fixed_height < self.row_height_cell:
                 raise HeightError
-            self.draw_row_fixed(text_list, width_list, align, fixed_height, False)
+            self.draw_row_fixed(text_list, width_list, align, fixed_height, False, cell_styles)
         elif option == 'responsive':
-            self.draw_row_responsive(text_list, width_list, align, False)
+            self.draw_row_responsive(text_list, width_list, align, False, max_rows, max_height, cell_styles)
         else:
             raise MismatchValueError
 
+    def table_rows(self, rows: list[list[str]], width_list: list[float] | TableSpec = [],
+                   align: list[Align] | Align = Align.L, option: str = 'line', fixed_height: float = None,
+                   max_rows: int | None = None, max_height: float | None = None, style: TableStyle | None = None,
+                   start: int = 0):
+        """
+        draw many rows of a table, the arguments are the same of table_row. the styles of all the rows are
+        calculated at once with the rules of style.
+
+        :param rows: list of rows, every row is a list of texts
+        :param width_list: list of width´s for every column or a TableSpec
+        :param align: alignment
+        :param option: define what type of row to draw
+        :param fixed_height: height if option is fixed
+        :param max_rows: maximum number of rows if option is responsive
+        :param max_height: maximum height if option is responsive
+        :param style: TableStyle
+        :param start: index of the first row in the table, for the row conditions of style
+        :return:
+        """
+        styles = style.calculate_styles(rows, start) if style is not None else [None] * len(rows)
+        for row, cell_styles in zip(rows, styles):
+            self.table_row(row, width_list, align, option, fixed_height, max_rows, max_height, cell_styles)
+
+    def table_bands(self, header: list[str] | None, rows: list[list[str]], width_list: list[float] | TableSpec = [],
+                    align: list[Align] | Align = Align.L, option: str = 'line', fixed_height: float = None,
+                    max_rows: int | None = None, max_height: float | None = None, style: TableStyle | None = None,
+                    bands: int | None = None, gap: float = 0):
+        """
+        draw a narrow table in side by side bands, the rows flow from the bottom of a band to the top of the next
+        one and from the last band of a page to the first band of the next page. the header is repeated at the top
+        of every band. band and page breaks are planned with the row heights, the rows never trigger a page
+        break. the other arguments are the same of table_header and table_rows.
+
+        :param header: list of the texts of the header or None
+        :param rows: list of rows, every row is a list of texts
+        :param width_list: list of width´s for every column or a TableSpec, i.e. table_cols(2, 2, 2)
+        :param align: alignment of the rows
+        :param option: define what type of row to draw
+        :param fixed_height: height if option is fixed
+        :param max_rows: maximum number of rows if option is responsive
+        :param max_height: maximum height if option is responsive
+        :param style: TableStyle, row conditions use the index of the row in rows
+        :param bands: number of bands per page, by default as many as fit in the effective page width
+        :param gap: minimum horizontal space between bands, the bands are spread over the effective page width
+        :return:
+        :raise WidthOverflowError: the bands don't fit in the effective page width
+        """
+        if not rows:
+            return
+        columns_count: int = len(rows[0])
+        # widths are resolved with the margins of the page, the bands move the left margin
+        if not isinstance(width_list, TableSpec):
+            width_list = self.calculate_width_list(width_list, columns_count)
+        table_width = sum(width_list.widths if isinstance(width_list, TableSpec) else width_list)
+        if bands is None:
+            bands = max(1, math.floor((self.epw + gap) / (table_width + gap) + 1e-9))
+        elif bands < 1 or bands * table_width + (bands - 1) * gap > self.epw \
+                and not math.isclose(bands * table_width + (bands - 1) * gap, self.epw):
+            raise WidthOverflowError
+        # distance between the left edges of two bands
+        step = table_width + max(0, (self.epw - bands * table_width) / (bands - 1)) if bands > 1 else 0
+        # rows are measured and drawn with the font table_header leaves
+        if header:
+            self.set_font(self.font, '', self.text_normal_size)
+        styles = style.calculate_styles(rows) if style is not None else [None] * len(rows)
+        heights = [self.calculate_row_height(row, width_list, align, option, fixed_height, max_rows, max_height,
+                                             cell_styles) for row, cell_styles in zip(rows, styles)]
+        header_height = self.row_height_cell if header else 0
+        l_margin, auto_page_break = self.l_margin, self.auto_page_break
+        self.set_auto_page_break(False, self.b_margin)
+        try:
+            start, band, top, bottom = 0, 0, self.y, self.y
+            while start < len(rows):
+                # every band starts at the same y, if the header and a row don't fit start a new page
+                if top > self.t_margin and top + header_height + heights[start] > self.page_break_trigger:
+                    band = bands
+                if band == bands:
+                    self.add_page()
+                    band, top, bottom = 0, self.y, self.y
+                # rows that fit in this band, at least one
+                y = top + header_height
+                end = start
+                while end < len(rows) and (end == start or y + heights[end] <= self.page_break_trigger):
+                    y += heights[end]
+                    end += 1
+                x = l_margin + band * step
+                self.set_left_margin(x)
+                self.set_xy(x, top)
+                if header:
+                    self.table_header(header, width_list)
+                for row, cell_styles in zip(rows[start:end], styles[start:end]):
+                    self.table_row(row, width_list, align, option, fixed_height, max_rows, max_height, cell_styles)
+                bottom = max(bottom, self.y)
+                start, band = end, band + 1
+        finally:
+            self.set_left_margin(l_margin)
+            self.set_auto_page_break(auto_page_break, self.b_margin)
+        # continue under the longest band
+        self.set_xy(l_margin, bottom)
+
     def table_cols(self, *args: float) -> list[float]:
         """
         calculate widths like bootstrap grid system
@@ -753,6 +1829,116 @@ class PDFTable(FPDF):
         return width_list
 
 
+class ColumnSpec(NamedTuple):
+    """
+    width and alignment of one column of a TableSpec.
+    """
+    width: float
+    align: Align
+
+
+class TableSpec(NamedTuple('TableSpec', [('columns', Tuple[ColumnSpec, ...]), ('widths', Tuple[float, ...]),
+                                         ('aligns', Tuple[Align, ...]), ('width', float)])):
+    """
+    immutable column layout of a table, built once with PDFTable.table_spec and passed to table_header and
+    table_row instead of a width list.
+    """
+    __slots__ = ()
+
+    def __new__(cls, width_list: list[float], align_list: list[Align], available_width: float | None = None):
+        """
+        :param width_list: list of width for every column in mm
+        :param align_list: list of alignment for every column
+        :param available_width: if given, total width is validated against it
+        :raise NumberElementsListMismatchError: widths and alignments count doesn't match
+        :raise WidthOverflowError: total width is larger than available_width
+        """
+        if len(width_list) != len(align_list):
+            raise NumberElementsListMismatchError
+        widths = tuple(width_list)
+        aligns = tuple(Align.coerce(align) for align in align_list)
+        total_width = sum(widths)
+        # tolerate float rounding of widths that add up exactly to the available width, i.e. table_cols(4, 8)
+        if available_width is not None and total_width > available_width \
+                and not math.isclose(total_width, available_width):
+            raise WidthOverflowError
+        columns = tuple(ColumnSpec(width, align) for width, align in zip(widths, aligns))
+        return super().__new__(cls, columns, widths, aligns, total_width)
+
+    def __reduce__(self):
+        # copy and pickle rebuild it from the fields, not from the arguments of __new__
+        return type(self)._make, (tuple(self),)
+
+
+class TextFlow:
+    """
+    text that is drawn through many fixed size containers with PDFTable.multi_cell_flow. keeps the line breaker
+    position, so every call continues where the previous one stopped and the text is broken in lines only once.
+    """
+
+    def __init__(self, pdf: PDFTable, txt: str, justify: bool = True, markdown: bool = False):
+        """
+        :param pdf: PDFTable, its current font is used to measure the text
+        :param txt: text
+        :param justify: justify text
+        :param markdown: markdown
+        """
+        self.font: tuple[str, str, float] = (pdf.font_family, pdf.font_style, pdf.font_size_pt)
+        normalized_string = pdf.normalize_text(txt).replace("\r", "")
+        styled_text_fragments = pdf._preload_font_styles(normalized_string, markdown)
+        self._multi_line_break = MultiLineBreak(
+            styled_text_fragments,
+            pdf.get_normalized_string_width_with_style,
+            justify=justify,
+        )
+        # line already broken but not drawn, with the width used and the breaker position before it
+        self._pending: tuple[float, TextLine, tuple] | None = None
+        self.finished: bool = not styled_text_fragments
+
+    def _position(self) -> tuple:
+        return (self._multi_line_break.fragment_index, self._multi_line_break.character_index,
+                self._multi_line_break.char_index_for_last_forced_manual_break)
+
+    def _next_line(self, maximum_allowed_emwidth: float) -> TextLine | None:
+        if self._pending is not None:
+            width, text_line, position = self._pending
+            self._pending = None
+            if width == maximum_allowed_emwidth:
+                return text_line
+            # the container width changed, break the line again from its start
+            (self._multi_line_break.fragment_index, self._multi_line_break.character_index,
+             self._multi_line_break.char_index_for_last_forced_manual_break) = position
+        return self._multi_line_break.get_line_of_given_width(maximum_allowed_emwidth)
+
+    def next_lines(self, pdf: PDFTable, w: float, row_quantity: int) -> list[TextLine]:
+        """
+        get the next lines that fit in a container and advance the flow.
+
+        :param pdf: PDFTable with the font of the flow set
+        :param w: container width
+        :param row_quantity: maximum number of lines
+        :return: list of lines
+        """
+        # longitud maxima disponible, self.c_margin es el margen en x
+        maximum_allowed_emwidth = (w - 2 * pdf.c_margin) * 1000 / pdf.font_size
+        text_lines = []
+        while not self.finished and len(text_lines) < row_quantity:
+            text_line = self._next_line(maximum_allowed_emwidth)
+            if text_line is None:
+                self.finished = True
+            else:
+                text_lines.append(text_line)
+        # peek the next line to know if there's text left, it's reused by the next container of the same width
+        if not self.finished:
+            position = self._position()
+            text_line = self._multi_line_break.get_line_of_given_width(maximum_allowed_emwidth)
+            if text_line is None:
+                self.finished = True
+            else:
+                self._pending = (maximum_allowed_emwidth, text_line, position)
+        return text_lines
+
+
 class SplitTextError(Exception):
     """
     Error to raise error when string.split() fails to split
@@ -802,6 +1988,9 @@ def base64_to_image(image_base64: str):
     :param image_base64: string base64
     :return: Image
     """
+    import base64
+    import io
+    from PIL import Image
     imagen_data = base64.b64decode(image_base64)
     try:
         # convertir y guardar imagen
@@ -843,6 +2032,7 @@ def add_image_local(filename: str, return_unit: str = 'mm') -> tuple[Image, floa
     :param return_unit: return unit of measurement, defaults to mm
     :return:
     """
+    from PIL import Image
     img = Image.open(filename)
     if img:
         width, height = img.size
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING, NamedTuple
+
+from fpdf_table.main import MismatchValueError
+
+if TYPE_CHECKING:
+    from fpdf_table.main import PDFTable
+
+
+def deep_sizeof(obj, seen: set[int] | None = None) -> int:
+    """
+    approximate size in bytes of an object and the objects it contains.
+
+    :param obj: object
+    :param seen: ids of objects already counted
+    :return: bytes
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+class MemorySample(NamedTuple):
+    # page number when the sample was taken
+    page: int
+    # memory traced by tracemalloc
+    traced: int
+    peak: int
+    # bytes of every subsystem, see PDFTable.memory_usage
+    subsystems: dict[str, int]
+
+
+class MemoryDiagnostics:
+    """
+    samples tracemalloc and the size of the PDFTable subsystems at page boundaries, to find out what grows in
+    large documents. created with PDFTable.enable_memory_diagnostics.
+    """
+
+    def __init__(self, every: int = 10, top: int = 10):
+        """
+        :param every: sample every n pages
+        :param top: number of allocation sites reported
+        :raise MismatchValueError: every is smaller than 1
+        """
+        if every < 1:
+            raise MismatchValueError
+        self.every = every
+        self.top = top
+        self.samples: list[MemorySample] = []
+        self._first_snapshot: tracemalloc.Snapshot | None = None
+        self._last_snapshot: tracemalloc.Snapshot | None = None
+        self._started = False
+
+    def start(self):
+        """
+        start tracemalloc if it isn't already tracing.
+
+        :return:
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+
+    def stop(self):
+        """
+        stop tracemalloc if it was started by start().
+
+        :return:
+        """
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def page_closed(self, pdf: PDFTable):
+        """
+        called by PDFTable when a page is closed.
+
+        :param pdf: PDFTable
+        :return:
+        """
+        if pdf.page % self.every == 0:
+            self.sample(pdf)
+
+    def sample(self, pdf: PDFTable) -> MemorySample:
+        """
+        take a sample now.
+
+        :param pdf: PDFTable
+        :return: MemorySample
+        """
+        traced, peak = 0, 0
+        if tracemalloc.is_tracing():
+            traced, peak = tracemalloc.get_traced_memory()
+            # only the first and last snapshots are kept, to compare them
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),))
+            if self._first_snapshot is None:
+                self._first_snapshot = snapshot
+            self._last_snapshot = snapshot
+        sample = MemorySample(pdf.page, traced, peak, pdf.memory_usage())
+        self.samples.append(sample)
+        return sample
+
+    def growth_per_page(self) -> dict[str, float]:
+        """
+        average growth in bytes per page of every subsystem and of the traced memory, between the first and the
+        last sample.
+
+        :return: bytes per page
+        """
+        if len(self.samples) < 2:
+            return {}
+        first, last = self.samples[0], self.samples[-1]
+        pages = last.page - first.page
+        growth = {key: (last.subsystems[key] - first.subsystems.get(key, 0)) / pages for key in last.subsystems}
+        growth['traced'] = (last.traced - first.traced) / pages
+        return growth
+
+    def top_allocations(self) -> list[tracemalloc.StatisticDiff]:
+        """
+        source lines whose allocations grew the most between the first and the last sample.
+
+        :return: list of tracemalloc.StatisticDiff
+        """
+        if self._first_snapshot is None or self._last_snapshot is self._first_snapshot:
+            return []
+        return self._last_snapshot.compare_to(self._first_snapshot, 'lineno')[:self.top]
+
+    def report(self) -> str:
+        """
+        readable summary of the growth per page and the top allocation sites.
+
+        :return: text
+        """
+        lines = ['growth per page:']
+        for key, value in self.growth_per_page().items():
+            lines.append(f'  {key}: {value:,.0f} B')
+        if self.samples:
+            lines.append(f'peak traced: {self.samples[-1].peak:,} B')
+        lines.append('top allocations:')
+        lines.extend(f'  {statistic}' for statistic in self.top_allocations())
+        return '\n'.join(lines)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import contextlib
+import queue
+from typing import Callable, Iterator
+
+from fpdf_table.main import PDFTable
+
+
+class PDFTablePool:
+    """
+    pool of ready to use PDFTable instances for long-running workers. released instances are reset and handed out
+    again, so fonts added by the factory are loaded only once per instance.
+    """
+
+    def __init__(self, factory: Callable[[], PDFTable] = PDFTable, max_size: int = 8):
+        """
+        :param factory: callable that creates a new PDFTable, i.e. adds custom fonts
+        :param max_size: maximum number of idle instances kept by the pool
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: queue.LifoQueue[PDFTable] = queue.LifoQueue(max_size)
+
+    def acquire(self) -> PDFTable:
+        """
+        get an idle instance or create a new one if the pool is empty.
+
+        :return: PDFTable with one page and default font and colors
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pdf = self.factory()
+            # the images are reused by the next documents drawn with this instance
+            pdf.keep_image_data = True
+            return pdf
+
+    def release(self, pdf: PDFTable):
+        """
+        reset an instance and return it to the pool, if the pool is full the instance is discarded.
+
+        :param pdf: instance returned by acquire
+        :return:
+        """
+        pdf.reset()
+        try:
+            self._idle.put_nowait(pdf)
+        except queue.Full:
+            pass
+
+    @contextlib.contextmanager
+    def pdf(self) -> Iterator[PDFTable]:
+        """
+        acquire an instance and release it when the block ends.
+
+        :return:
+        """
+        pdf = self.acquire()
+        try:
+            yield pdf
+        finally:
+            self.release(pdf)
+
+    def __len__(self):
+        return self._idle.qsize()
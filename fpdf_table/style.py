@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, FrozenSet, NamedTuple, Optional, Sequence, Tuple, Union
+
+from fpdf.drawing import DeviceGray, DeviceRGB
+
+# grey level or (r, g, b) with values between 0 and 255
+Color = Union[int, Tuple[int, int, int]]
+
+
+def convert_color(color: Color | None) -> DeviceGray | DeviceRGB | None:
+    """
+    convert a color like FPDF.set_fill_color does.
+
+    :param color: grey level, (r, g, b) or None
+    :return: fpdf color or None
+    """
+    if color is None:
+        return None
+    if isinstance(color, int):
+        return DeviceGray(color / 255)
+    r, g, b = color
+    if r == 0 and g == 0 and b == 0:
+        return DeviceGray(0)
+    return DeviceRGB(r / 255, g / 255, b / 255)
+
+
+class CellStyle(NamedTuple):
+    """
+    immutable fill color, text color and font style of a cell. None attributes keep the style of the table.
+    """
+    fill_color: DeviceGray | DeviceRGB | None = None
+    text_color: DeviceGray | DeviceRGB | None = None
+    font_style: str | None = None
+
+    def merge(self, other: CellStyle) -> CellStyle:
+        """
+        style with the attributes of other that are not None over the attributes of this style.
+
+        :param other: CellStyle
+        :return: CellStyle
+        """
+        return CellStyle(self.fill_color if other.fill_color is None else other.fill_color,
+                         self.text_color if other.text_color is None else other.text_color,
+                         self.font_style if other.font_style is None else other.font_style)
+
+
+class StyleRule(NamedTuple('StyleRule', [('rows', Any), ('columns', Optional[FrozenSet[int]]),
+                                         ('when', Optional[Callable[[Any], bool]]), ('style', CellStyle)])):
+    """
+    condition on the row index, the column and the value of a cell, and the style applied to the cells that
+    match it.
+    """
+    __slots__ = ()
+
+    def __new__(cls, rows: slice | Collection[int] | Callable[[int], bool] | None = None,
+                columns: Collection[int] | None = None, when: Callable[[Any], bool] | None = None,
+                fill_color: Color | None = None, text_color: Color | None = None, font_style: str | None = None):
+        """
+        :param rows: rows where the rule applies, a slice (i.e. slice(1, None, 2) for zebra striping), a
+            collection of indexes or a function of the row index. None is every row
+        :param columns: indexes of the columns where the rule applies, None is every column
+        :param when: function of the value of the cell, the rule applies if it returns True
+        :param fill_color: grey level or (r, g, b) of the background of the cell
+        :param text_color: grey level or (r, g, b) of the text
+        :param font_style: font style, i.e. 'B' for bold or '' for regular
+        """
+        return super().__new__(cls, rows if rows is None or isinstance(rows, slice) or callable(rows)
+                               else frozenset(rows),
+                               None if columns is None else frozenset(columns), when,
+                               CellStyle(convert_color(fill_color), convert_color(text_color), font_style))
+
+    def __reduce__(self):
+        # copy and pickle rebuild it from the fields, not from the arguments of __new__
+        return type(self)._make, (tuple(self),)
+
+
+class TableStyle:
+    """
+    rules compiled once and evaluated over whole batches of rows. rules are applied in order, a later rule
+    overrides the attributes set by a previous one. the styles of rows that match the same rules without value
+    conditions are calculated only once. a TableStyle can be shared by documents drawn in different threads.
+
+    style = TableStyle(StyleRule(rows=slice(1, None, 2), fill_color=245),
+                       StyleRule(columns=[2], when=lambda value: value.startswith('-'), text_color=(200, 0, 0)))
+    """
+
+    def __init__(self, *rules: StyleRule):
+        """
+        :param rules: StyleRule list
+        """
+        self.rules = rules
+        # rules that apply to every row are resolved without calling anything
+        self._all_rows = tuple(i for i, rule in enumerate(rules) if rule.rows is None)
+        self._row_rules = tuple((i, rule.rows) for i, rule in enumerate(rules) if rule.rows is not None)
+        # styles of the rows, by rules that matched the row index and columns count
+        self._row_styles: dict[tuple, tuple[tuple[CellStyle | None, ...], tuple]] = {}
+        # every merged style is built once and shared
+        self._merged: dict[tuple, CellStyle] = {}
+
+    def calculate_styles(self, rows: Sequence[Sequence[Any]], start: int = 0) \
+            -> list[tuple[CellStyle | None, ...] | None]:
+        """
+        style of every cell of a batch of rows.
+
+        :param rows: list of rows, every row is a list of values
+        :param start: index of the first row of the batch in the table, used by the row conditions
+        :return: for every row a tuple with the style of every cell or None, or None if no rule matched the row
+        """
+        total = start + len(rows)
+        # slices are converted to ranges once per batch, so negative indexes are relative to the batch end
+        row_rules = tuple((i, range(*rows_.indices(total)) if isinstance(rows_, slice) else rows_)
+                          for i, rows_ in self._row_rules)
+        styles = []
+        for index, row in enumerate(rows, start):
+            matched = self._all_rows + tuple(i for i, rows_ in row_rules
+                                             if (rows_(index) if callable(rows_) else index in rows_))
+            if not matched:
+                styles.append(None)
+                continue
+            fixed, conditional = self.get_row_style(matched, len(row))
+            if not conditional:
+                styles.append(fixed)
+                continue
+            cells = list(fixed)
+            for column, rule_ids in conditional:
+                value = row[column]
+                passed = tuple(i for i in rule_ids if self.rules[i].when(value))
+                if passed:
+                    cells[column] = self.merge_rules(column, matched, passed)
+            styles.append(tuple(cells))
+        return styles
+
+    def get_row_style(self, matched: tuple[int, ...], columns_count: int) \
+            -> tuple[tuple[CellStyle | None, ...], tuple[tuple[int, tuple[int, ...]], ...]]:
+        """
+        styles of the cells of a row without the value conditions, and the value conditions of every column.
+
+        :param matched: indexes of the rules that matched the row index
+        :param columns_count: columns count
+        :return: styles of the cells and (column, rule indexes) of the rules with value conditions
+        """
+        key = (matched, columns_count)
+        row_style = self._row_styles.get(key)
+        if row_style is None:
+            cells = []
+            conditional = []
+            for column in range(columns_count):
+                rule_ids = tuple(i for i in matched
+                                 if self.rules[i].columns is None or column in self.rules[i].columns)
+                cells.append(self.merge_rules(column, matched, ()))
+                when_ids = tuple(i for i in rule_ids if self.rules[i].when is not None)
+                if when_ids:
+                    conditional.append((column, when_ids))
+            row_style = (tuple(cells), tuple(conditional))
+            self._row_styles[key] = row_style
+        return row_style
+
+    def merge_rules(self, column: int, matched: tuple[int, ...], passed: tuple[int, ...]) -> CellStyle | None:
+        """
+        merge in order the rules of a cell.
+
+        :param column: column index
+        :param matched: indexes of the rules that matched the row index
+        :param passed: indexes of the rules whose value condition passed
+        :return: CellStyle or None if no rule applies
+        """
+        rule_ids = tuple(i for i in matched if (self.rules[i].columns is None or column in self.rules[i].columns)
+                         and (self.rules[i].when is None or i in passed))
+        if not rule_ids:
+            return None
+        style = self._merged.get(rule_ids)
+        if style is None:
+            style = CellStyle()
+            for i in rule_ids:
+                style = style.merge(self.rules[i].style)
+            self._merged[rule_ids] = style
+        return style
@@ -0,0 +1,32 @@
+import math
+
+from tests.utils import RecordingPDFTable, assert_inside_pages, output
+
+ROWS = [[str(i), f'name {i}', f'{i * 37 % 1000}'] for i in range(300)]
+
+
+def test_bands_fill_pages():
+    pdf = RecordingPDFTable()
+    pdf.table_bands(['id', 'name', 'amount'], ROWS, pdf.table_cols(2, 2, 2))
+    assert_inside_pages(pdf)
+    one_band = RecordingPDFTable()
+    one_band.table_bands(['id', 'name', 'amount'], ROWS, one_band.table_cols(2, 2, 2), bands=1)
+    # two bands per page, every band starts with a header
+    assert pdf.page == math.ceil(one_band.page / 2)
+    assert len({x for page, x, y, height in pdf.drawn}) == 2
+
+
+def test_bands_start_on_new_page_near_the_bottom():
+    pdf = RecordingPDFTable()
+    pdf.set_y(pdf.h - 12)
+    pdf.table_bands(['id', 'name', 'amount'], ROWS[:10], pdf.table_cols(2, 2, 2))
+    assert_inside_pages(pdf)
+    assert all(page == 2 for page, x, y, height in pdf.drawn)
+
+
+def test_bands_output_is_valid_with_responsive_rows():
+    pdf = RecordingPDFTable()
+    rows = [row[:2] + ['long text that wraps in more than one line ' * (i % 3)] for i, row in enumerate(ROWS)]
+    pdf.table_bands(['id', 'name', 'text'], rows, pdf.table_cols(1, 1, 3), option='responsive')
+    assert_inside_pages(pdf)
+    assert output(pdf).startswith(b'%PDF')
@@ -0,0 +1,30 @@
+from fpdf_table import PDFTable
+from fpdf_table.cache import LRUCache
+
+
+def test_resize_drops_least_recently_used():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache.set(key, key)
+    cache.get('a')
+    cache.resize(2)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    cache.resize(0)
+    cache.set('d', 'd')
+    assert len(cache) == 0
+
+
+def test_text_cache_size_applies_after_init():
+    pdf = PDFTable()
+    for i in range(10):
+        pdf.calculate_text_rows(20, f'text {i} ' * 10)
+    assert len(pdf.text_cache) > 2
+    pdf.text_cache_size = 2
+    pdf.calculate_text_rows(20, 'other text ' * 10)
+    assert len(pdf.text_cache) == 2
+    pdf.text_cache_size = 0
+    pdf.calculate_text_rows(20, 'more text ' * 10)
+    assert len(pdf.text_cache) == 0
+    pdf.text_cache_size = 100
+    pdf.calculate_text_rows(20, 'more text ' * 10)
+    assert len(pdf.text_cache) > 0
@@ -0,0 +1,66 @@
+import zlib
+
+from fpdf import FPDF
+
+from fpdf_table import PDFTable
+from tests.utils import output
+
+ROWS = [[str(i), f'name {i}', 'lorem ipsum dolor sit amet ' * (1 + i % 4)] for i in range(300)]
+
+
+class FPDFPutPagesTable(PDFTable):
+    """
+    PDFTable that writes the pages with fpdf.
+    """
+
+    def _putpages(self):
+        FPDF._putpages(self)
+
+
+def draw(pdf: PDFTable) -> bytes:
+    pdf.alias_nb_pages()
+    pdf.add_page()
+    pdf.cell(txt='page {nb}', link='https://example.com')
+    pdf.ln()
+    pdf.table_rows(ROWS, pdf.table_cols(1, 3, 8), option='responsive')
+    return output(pdf)
+
+
+def test_default_output_is_same_as_fpdf():
+    assert PDFTable.compression_level == zlib.Z_DEFAULT_COMPRESSION
+    assert draw(PDFTable()) == draw(FPDFPutPagesTable())
+
+
+def test_released_and_threaded_pages_are_same_as_fpdf():
+    expected = draw(FPDFPutPagesTable())
+    released = PDFTable()
+    released.release_closed_pages = True
+    threaded = PDFTable()
+    threaded.compression_workers = 2
+    assert draw(released) == expected
+    assert draw(threaded) == expected
+
+
+def test_compression_level_changes_only_page_streams():
+    fast = PDFTable()
+    fast.compression_level = 1
+    best = PDFTable()
+    best.compression_level = 9
+    fast_output, best_output = draw(fast), draw(best)
+    assert len(best_output) < len(fast_output)
+    assert fast_output.count(b'/FlateDecode') == best_output.count(b'/FlateDecode')
+
+
+def test_write_to_page_compressed_by_a_thread():
+    documents = []
+    for compression_workers in (0, 2):
+        pdf = PDFTable()
+        pdf.compression_workers = compression_workers
+        pdf.table_rows(ROWS, pdf.table_cols(1, 3, 8), option='responsive')
+        last_page = pdf.page
+        pdf.page = 1
+        pdf.set_xy(pdf.l_margin, pdf.t_margin)
+        pdf.cell(txt=f'pages: {last_page}')
+        pdf.page = last_page
+        documents.append(output(pdf))
+    assert documents[0] == documents[1]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+import sys
+
+import pytest
+from fpdf.errors import FPDFUnicodeEncodingException
+
+from fpdf_table import PDFTable
+from tests.utils import FONT_FILE
+
+WORDS = ['id', '2024-01-31', '1234.56', 'lorem', 'ipsum', 'dolor', 'áéíóú', 'consectetur', 'W' * 30, 'i' * 40,
+         'a\nb', 'soft­hyphen', 'x']
+
+
+class BreakerPDFTable(PDFTable):
+    """
+    PDFTable that always breaks the whole text in lines, without the one line and prefix fast paths.
+    """
+
+    def check_text_fits_line(self, w, txt):
+        return False
+
+    def calculate_text_capacity(self, w, row_quantity):
+        return sys.maxsize
+
+
+def create_pdfs(font: str) -> tuple[PDFTable, PDFTable]:
+    pdfs = PDFTable(), BreakerPDFTable()
+    for pdf in pdfs:
+        if font != 'Helvetica':
+            pdf.add_font(font, '', FONT_FILE)
+        pdf.set_font(font, '', 8)
+    return pdfs
+
+
+def random_texts(seed: int, count: int) -> list[str]:
+    generator = random.Random(seed)
+    return [' '.join(generator.choices(WORDS, k=generator.choice([1, 1, 2, 3, 8, 30, 200]))) for _ in range(count)]
+
+
+@pytest.mark.parametrize('font', ['Helvetica', 'Lato'])
+def test_one_line_fast_path_is_same_as_breaker(font):
+    pdf, breaker = create_pdfs(font)
+    fast = 0
+    for i, txt in enumerate(random_texts(0, 500)):
+        w = (5, 20, 40, 100)[i % 4]
+        fits = pdf.check_text_fits_line(w, txt)
+        fast += fits
+        if fits:
+            lines, text_is_larger = breaker.calculate_text_fragments(w, txt, 1)
+            assert len(lines) == 1 and not text_is_larger, txt
+        assert pdf.calculate_text_rows(w, txt) == breaker.calculate_text_rows(w, txt), txt
+        assert pdf.calculate_text_rows(w, txt, max_rows=2) == breaker.calculate_text_rows(w, txt, max_rows=2), txt
+    # both paths were tested
+    assert 0 < fast < 500
+
+
+@pytest.mark.parametrize('font', ['Helvetica', 'Lato'])
+def test_fixed_height_prefix_is_same_as_breaker(font):
+    pdf, breaker = create_pdfs(font)
+    for i, txt in enumerate(random_texts(1, 500)):
+        w = (5, 20, 40, 100)[i % 4]
+        container_height = (3, 5, 10, 30)[i % 3]
+        ellipsis = i % 5 == 0
+        assert pdf.fit_text_fixed_height(txt, 3, w, container_height, ellipsis=ellipsis) == \
+            breaker.fit_text_fixed_height(txt, 3, w, container_height, ellipsis=ellipsis), txt
+
+
+@pytest.mark.parametrize('start', ['', "'" * 100, '\r' * 5000], ids=['words', 'quotes', 'carriage-returns'])
+def test_fixed_height_huge_text_is_same_as_breaker(start):
+    # a prefix of characters without width doesn't fill the container and has to be extended
+    pdf, breaker = create_pdfs('Helvetica')
+    txt = start + ' '.join(['lorem'] * 20000)
+    assert pdf.fit_text_fixed_height(txt, 3, 40, 9) == breaker.fit_text_fixed_height(txt, 3, 40, 9)
+
+
+def test_fast_path_normalizes_the_text():
+    pdf, breaker = create_pdfs('Helvetica')
+    with pytest.raises(FPDFUnicodeEncodingException):
+        pdf.calculate_text_rows(40, '€5')
+    with pytest.raises(FPDFUnicodeEncodingException):
+        pdf.fit_text_fixed_height('€5', 5, 40, 10)
+    # with cp1252 the euro sign is measured with the width of its code
+    for table in (pdf, breaker):
+        table.core_fonts_encoding = 'windows-1252'
+    w = 2 * pdf.c_margin + pdf.get_normalized_string_width_with_style('\x80' * 10, '') * pdf.font_size / 1000 + 0.1
+    for txt in ('€' * 10, '€' * 11, '€5 €5 €5'):
+        assert pdf.calculate_text_rows(w, txt) == breaker.calculate_text_rows(w, txt), txt
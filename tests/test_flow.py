@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from fpdf.enums import Align
+
+from fpdf_table import PDFTable
+from tests.utils import output
+
+TEXT = ' '.join(['Lorem Ipsum is simply dummy text of the printing and typesetting industry.\n'
+                 'It has survived not only five centuries, but also the leap into electronic typesetting.'] * 6)
+
+
+def draw_fixed(widths: list[float], align: Align, header: bool = False) -> bytes:
+    pdf = PDFTable()
+    rest = TEXT
+    for i, w in enumerate(widths):
+        if header and i:
+            pdf.add_page()
+            pdf.set_font(pdf.font, 'B', 14)
+            pdf.cell(txt='header', line_break=True)
+            pdf.set_font(pdf.font, '', pdf.text_normal_size)
+        rest = pdf.multi_cell_fixed(w, rest, 5, 20, align=align, line_break=True)
+        if header and i:
+            pdf.set_font(pdf.font, 'B', 14)
+    assert not rest
+    return output(pdf)
+
+
+def draw_flow(widths: list[float], align: Align, header: bool = False) -> bytes:
+    pdf = PDFTable()
+    flow = pdf.text_flow(TEXT, justify=align == Align.J)
+    for i, w in enumerate(widths):
+        if header and i:
+            pdf.add_page()
+            pdf.set_font(pdf.font, 'B', 14)
+            pdf.cell(txt='header', line_break=True)
+        flow = pdf.multi_cell_flow(w, flow, 5, 20, align=align, line_break=True)
+        if header and i:
+            # the font of the page is kept after the flow is drawn
+            assert (pdf.font_style, pdf.font_size_pt) == ('B', 14)
+    assert flow.finished
+    return output(pdf)
+
+
+@pytest.mark.parametrize('align', [Align.J, Align.L])
+def test_flow_is_same_as_chained_multi_cell_fixed(align):
+    widths = [60] * 14
+    assert draw_flow(widths, align) == draw_fixed(widths, align)
+
+
+def test_flow_continues_in_a_new_page_with_another_font():
+    widths = [60] * 14
+    assert draw_flow(widths, Align.J, header=True) == draw_fixed(widths, Align.J, header=True)
+
+
+def test_flow_breaks_the_peeked_line_again_when_the_width_changes():
+    widths = [60, 40, 40, 90, 30, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60]
+    pdf = PDFTable()
+    flow = pdf.text_flow(TEXT)
+    flow.next_lines(pdf, 60, 4)
+    # the next line was broken for 60 to know if there is text left
+    assert flow._pending is not None
+    next_line = flow.next_lines(pdf, 40, 1)[0]
+    assert next_line.text_width / 1000 * pdf.font_size <= 40 - 2 * pdf.c_margin
+    assert draw_flow(widths, Align.J) == draw_fixed(widths, Align.J)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import re
+
+from fpdf_table import PDFTable
+
+ROWS = [[str(i), f'name {i}', 'lorem ipsum dolor sit amet ' * (1 + i % 3)] for i in range(150)]
+SEGMENT = re.compile(r'(-?[\d.]+) (-?[\d.]+) m (-?[\d.]+) (-?[\d.]+) l')
+
+
+def create_pdf() -> PDFTable:
+    pdf = PDFTable()
+    pdf.set_compression(False)
+    pdf.grid_borders = True
+    return pdf
+
+
+def page_lines(pdf: PDFTable, page: int) -> list[str]:
+    return bytes(pdf.get_page_content(page)).decode('latin-1').split('\n')
+
+
+def grid_paths(pdf: PDFTable, page: int) -> list[str]:
+    return [line for line in page_lines(pdf, page) if line.endswith(' S') or line.endswith(' S Q')]
+
+
+def test_grid_has_no_duplicated_edges():
+    pdf = create_pdf()
+    pdf.table_header(['id', 'name', 'description'], pdf.table_cols(2, 4, 6))
+    pdf.table_rows(ROWS[:20], pdf.table_cols(2, 4, 6), option='responsive')
+    pdf.draw_grid()
+    paths = grid_paths(pdf, 1)
+    assert len(paths) == 1
+    # segments on the same line don't overlap or touch, touching segments are merged
+    lines = {}
+    for x1, y1, x2, y2 in (map(float, segment) for segment in SEGMENT.findall(paths[0])):
+        assert x1 == x2 or y1 == y2
+        key, start, end = (('h', y1), x1, x2) if y1 == y2 else (('v', x1), y1, y2)
+        lines.setdefault(key, []).append((start, end))
+    for segments in lines.values():
+        segments.sort()
+        assert all(previous[1] < start for previous, (start, _) in zip(segments, segments[1:]))
+    # 21 rows have 22 horizontal lines and 4 columns of vertical ones
+    assert len([key for key in lines if key[0] == 'h']) == 22
+    assert len([key for key in lines if key[0] == 'v']) == 4
+
+
+def test_grid_is_one_path_per_page():
+    pdf = create_pdf()
+    pdf.table_rows(ROWS, pdf.table_cols(2, 4, 6), option='responsive')
+    pdf.output()
+    assert pdf.page > 2
+    for page in range(1, pdf.page + 1):
+        paths = grid_paths(pdf, page)
+        assert len(paths) == 1 and not paths[0].startswith('q ')
+        # the borders of every page are inside the page
+        ys = [float(y) for _, y, _, _ in SEGMENT.findall(paths[0])]
+        assert min(ys) >= pdf.b_margin * pdf.k and max(ys) <= (pdf.h - pdf.t_margin) * pdf.k + 0.01
+
+
+def test_grid_with_other_draw_color_or_line_width_is_drawn_in_local_context():
+    pdf = create_pdf()
+    columns = pdf.table_cols(6, 6)
+    pdf.table_row(['a', 'b'], columns)
+    pdf.set_draw_color(255, 0, 0)
+    pdf.table_row(['c', 'd'], columns)
+    pdf.set_line_width(0.5)
+    pdf.table_row(['e', 'f'], columns)
+    pdf.draw_grid()
+    paths = grid_paths(pdf, 1)
+    assert len(paths) == 3
+    assert paths[0].startswith('q 0.8627 0.8627 0.8627 RG 0.57 w ') and paths[0].endswith(' S Q')
+    assert paths[1].startswith('q 1 0 0 RG 0.57 w ') and paths[1].endswith(' S Q')
+    # the borders drawn with the current settings don't need a local context
+    assert not paths[2].startswith('q ')
+    assert pdf.grid_cells == {}
+
+
+def test_draw_grid_before_drawing_over_a_table():
+    pdf = create_pdf()
+    pdf.table_rows(ROWS[:5], pdf.table_cols(2, 4, 6))
+    pdf.draw_grid()
+    pdf.set_fill_color(255, 255, 0)
+    pdf.rect(pdf.l_margin, pdf.t_margin, 20, 20, style='F')
+    pdf.output()
+    lines = page_lines(pdf, 1)
+    paths = grid_paths(pdf, 1)
+    fill = next(i for i, line in enumerate(lines) if line.endswith(' re f'))
+    # the grid is under the rectangle and it's not drawn again when the page is closed
+    assert len(paths) == 1 and lines.index(paths[0]) < fill
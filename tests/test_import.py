@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules loaded by `import fpdf_table` besides fpdf and its dependencies, the optional parts are lazy
+EAGER_MODULES = {'fpdf_table', 'fpdf_table.main', 'fpdf_table.cache', 'fpdf_table.fonts', 'fpdf_table.style'}
+# time in ms `import fpdf_table` may add to `import fpdf`
+IMPORT_BUDGET = 10
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def test_import_loads_only_eager_modules():
+    result = run_python('-c', 'import sys, fpdf; before = set(sys.modules); import fpdf_table; '
+                              'print(*sorted(set(sys.modules) - before))')
+    assert set(result.stdout.split()) == EAGER_MODULES
+
+
+def test_import_time():
+    # the first run writes the bytecode of the modules
+    run_python('-c', 'import fpdf_table')
+    overheads = []
+    for _ in range(3):
+        # fpdf and its dependencies are imported first, fpdf_table only counts what it adds
+        stderr = run_python('-X', 'importtime', '-c', 'import fpdf; import fpdf_table').stderr
+        # lines are "import time: self [us] | cumulative | imported package"
+        cumulative = {line.split('|')[2].strip(): int(line.split('|')[1]) for line in stderr.splitlines()
+                      if line.startswith('import time:') and line.split('|')[1].strip().isdigit()}
+        overheads.append(cumulative['fpdf_table'] / 1000)
+    assert min(overheads) < IMPORT_BUDGET
@@ -0,0 +1,51 @@
+from fpdf_table import IncrementalRenderer, PDFTable, StyleRule, TableStyle
+from tests.utils import RecordingPDFTable, assert_inside_pages, output
+
+ROWS = [[str(i), f'name {i}', f'{i * 37 % 1000 - 200}'] for i in range(120)]
+
+
+def render(renderer: IncrementalRenderer, **kwargs) -> tuple:
+    pdf = PDFTable()
+    stats = renderer.render_table(pdf, ['id', 'name', 'amount'], ROWS, pdf.table_cols(2, 6, 4), **kwargs)
+    return stats, output(pdf)
+
+
+def test_cached_render_is_same_as_rendered(tmp_path):
+    renderer = IncrementalRenderer(str(tmp_path))
+    first_stats, first = render(renderer, option='responsive')
+    second_stats, second = render(renderer, option='responsive')
+    assert first_stats.cached == 0 and second_stats.rendered == 0
+    assert first == second
+
+
+def test_prune_keeps_only_used_pages(tmp_path):
+    renderer = IncrementalRenderer(str(tmp_path))
+    render(renderer, option='responsive')
+    render(renderer, option='line')
+    pages = len(list(tmp_path.iterdir()))
+    # both renders used their pages
+    assert renderer.prune() == 0
+    stats, _ = render(renderer, option='responsive')
+    assert 0 < stats.cached < pages
+    assert renderer.prune() == pages - stats.cached
+    assert len(list(tmp_path.iterdir())) == stats.cached
+    stats, _ = render(renderer, option='responsive')
+    assert stats.rendered == 0
+
+
+def test_cached_render_loads_fonts_of_styles(tmp_path):
+    style = TableStyle(StyleRule(columns=[2], when=lambda value: value.startswith('-'), font_style='I'))
+    renderer = IncrementalRenderer(str(tmp_path))
+    _, first = render(renderer, style=style)
+    second_stats, second = render(renderer, style=style)
+    assert second_stats.rendered == 0
+    assert first == second
+
+
+def test_render_starts_on_new_page_near_the_bottom(tmp_path):
+    pdf = RecordingPDFTable()
+    pdf.set_y(pdf.h - 8)
+    IncrementalRenderer(str(tmp_path)).render_table(pdf, ['id', 'name', 'amount'], ROWS[:10],
+                                                    pdf.table_cols(2, 6, 4))
+    assert_inside_pages(pdf)
+    assert all(page == 2 for page, x, y, height in pdf.drawn)
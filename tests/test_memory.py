@@ -0,0 +1,65 @@
+import pytest
+
+from fpdf_table import MemoryDiagnostics, PDFTable
+from fpdf_table.main import MismatchValueError
+from tests.utils import output
+
+# bytes a document may grow per page when closed pages are released, the compressed content of a page of this
+# table is about 1.8 KB, without releasing the pages it grows about 17 KB per page
+MEMORY_PER_PAGE = 4096
+
+
+def draw_pages(pdf: PDFTable):
+    columns = pdf.table_cols(2, 6, 4)
+    for i in range(3000):
+        pdf.table_row([str(i), f'name {i}', 'texto ' * (i % 9)], columns)
+
+
+def test_released_pages_memory_ceiling():
+    pdf = PDFTable()
+    pdf.release_closed_pages = True
+    diagnostics = pdf.enable_memory_diagnostics(every=10)
+    try:
+        draw_pages(pdf)
+    finally:
+        diagnostics.stop()
+    assert pdf.page > 50
+    growth = diagnostics.growth_per_page()
+    assert growth['traced'] < MEMORY_PER_PAGE
+    assert growth['page_content'] < MEMORY_PER_PAGE
+    assert growth['layout_caches'] == 0
+
+
+def test_released_pages_total_pages_alias():
+    documents = []
+    for release_closed_pages in (False, True):
+        pdf = PDFTable()
+        pdf.release_closed_pages = release_closed_pages
+        pdf.alias_nb_pages()
+        pdf.add_page()
+        pdf.cell(txt='total {nb}')
+        pdf.ln()
+        draw_pages(pdf)
+        documents.append(output(pdf))
+    assert documents[0] == documents[1]
+
+
+def test_memory_diagnostics_every_must_be_positive():
+    with pytest.raises(MismatchValueError):
+        MemoryDiagnostics(every=0)
+
+
+def test_write_to_released_page():
+    documents = []
+    for release_closed_pages in (False, True):
+        pdf = PDFTable()
+        pdf.release_closed_pages = release_closed_pages
+        draw_pages(pdf)
+        last_page = pdf.page
+        # i.e. a total written on the first page when the table ends
+        pdf.page = 1
+        pdf.set_xy(pdf.l_margin, pdf.t_margin)
+        pdf.cell(txt=f'pages: {last_page}')
+        pdf.page = last_page
+        documents.append(output(pdf))
+    assert documents[0] == documents[1]
@@ -0,0 +1,106 @@
+import re
+import zlib
+
+from PIL import Image
+
+from fpdf_table import PDFTable, PDFTablePool
+from tests.utils import create_pdf_lato, output
+
+
+def draw_hello(pdf: PDFTable):
+    pdf.set_font('Lato', '', 10)
+    pdf.cell(txt='hello')
+
+
+def test_reset_ttf_document_is_same_as_new_instance():
+    pdf = create_pdf_lato()
+    pdf.set_font('Lato', 'B', 10)
+    pdf.cell(txt='the quick brown fox jumps over the lazy dog 0123456789 áéíóú')
+    output(pdf)
+    pdf.reset()
+    draw_hello(pdf)
+    new = create_pdf_lato()
+    draw_hello(new)
+    assert output(pdf) == output(new)
+
+
+def test_reset_drops_core_fonts_of_previous_document():
+    pdf = PDFTable()
+    pdf.set_font('Times', '', 10)
+    pdf.cell(txt='times')
+    output(pdf)
+    pdf.reset()
+    pdf.cell(txt='helvetica')
+    new = PDFTable()
+    new.cell(txt='helvetica')
+    assert output(pdf) == output(new)
+
+
+def test_pool_documents_do_not_grow():
+    pool = PDFTablePool(create_pdf_lato, max_size=1)
+    with pool.pdf() as pdf:
+        pdf.set_font('Lato', '', 10)
+        pdf.cell(txt='abcdefghijklmnopqrstuvwxyz')
+        output(pdf)
+    sizes = []
+    for _ in range(2):
+        with pool.pdf() as pdf:
+            draw_hello(pdf)
+            sizes.append(len(output(pdf)))
+    new = create_pdf_lato()
+    draw_hello(new)
+    assert sizes == [len(output(new))] * 2
+
+
+def test_output_drops_image_data():
+    pdf = PDFTable()
+    pdf.image(Image.new('RGB', (10, 10), (200, 0, 0)))
+    output(pdf)
+    assert all('data' not in info for info in pdf.images.values())
+
+
+def test_pool_reuses_images():
+    image = Image.new('RGB', (10, 10), (200, 0, 0))
+    pool = PDFTablePool(max_size=1)
+    documents = []
+    for _ in range(2):
+        with pool.pdf() as pdf:
+            pdf.image(image)
+            documents.append(output(pdf))
+    new = PDFTable()
+    new.image(image)
+    assert documents == [output(new)] * 2
+
+
+def test_pool_image_cache_is_bounded():
+    pool = PDFTablePool(max_size=1)
+    shared = Image.new('RGB', (10, 10), (0, 0, 200))
+    for i in range(50):
+        with pool.pdf() as pdf:
+            pdf.image(shared)
+            pdf.image(Image.new('RGB', (10, 10), (i, 0, 0)))
+            output(pdf)
+            images = len(pdf.images)
+    # the images of this document and the unique image of the previous one
+    assert images == 3
+    with pool.pdf() as pdf:
+        # only the images of the last document are kept
+        assert len(pdf.images) == 2
+        pdf.image(Image.new('RGB', (10, 10), (0, 200, 0)))
+        assert sorted(info['i'] for info in pdf.images.values()) == [1, 2, 3]
+
+
+def test_pool_renumbers_kept_images():
+    a, b, c = (Image.new('RGB', (10, 10), color) for color in ((200, 0, 0), (0, 200, 0), (0, 0, 200)))
+    pool = PDFTablePool(max_size=1)
+    for images in ((a, b), (b, c), (c, a, b)):
+        with pool.pdf() as pdf:
+            for image in images:
+                pdf.image(image)
+            document = output(pdf)
+        content = zlib.decompress(re.search(rb'stream\n(.*?)\nendstream', document, re.S).group(1))
+        names = re.findall(rb'/(I\d+) Do', content)
+        # every image drawn has its own resource
+        assert len(set(names)) == len(images)
+        xobjects = re.search(rb'/XObject <<(.*?)>>', document, re.S).group(1)
+        assert all(b'/' + name + b' ' in xobjects for name in names)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from fpdf import FPDF
+from fpdf.enums import Align
+
+from fpdf_table import PDFTable
+from fpdf_table.main import HeightError
+from tests.utils import output
+
+URL = 'see https://example.com/' + 'a' * 300
+WORDS = ['lorem', 'ipsum', 'i', 'consectetur', 'a\nb', '\n', 'x' * 60, 'https://example.com/' + 'b' * 80]
+# words shorter than the cells, a token longer than the line can be broken in other lines once the text is cut
+SHORT_WORDS = [word for word in WORDS if len(word) < 40] + ['', ' ', 'dolor\r\n', 'con\xadsec\xadte\xadtur' * 3]
+
+
+class MultiCellPDFTable(PDFTable):
+    """
+    breaks the text of the fixed cells again with multi_cell, like before the lines were reused.
+    """
+
+    def draw_text_lines(self, w, h, txt, text_lines, align=Align.J):
+        super().draw_text_lines(w, h, txt, None, align)
+
+
+def draw_row(text: str, **kwargs) -> tuple[PDFTable, float]:
+    pdf = PDFTable()
+    y = pdf.y
+    pdf.table_row(['id', text], pdf.table_cols(2, 10), option='responsive', **kwargs)
+    return pdf, pdf.y - y
+
+
+def split_lines(pdf: PDFTable, w: float, txt: str) -> list[str]:
+    # lines multi_cell draws, PDFTable.multi_cell doesn't return them
+    return FPDF.multi_cell(pdf, w=w, h=5, txt=txt, border=0, split_only=True)
+
+
+@pytest.mark.parametrize('cap', [{'max_rows': 3}, {'max_height': 15}])
+def test_long_token_is_truncated_to_the_cap(cap):
+    pdf, height = draw_row(URL, **cap)
+    assert height == pytest.approx(3 * pdf.row_height_multi_cell)
+    _, uncapped = draw_row(URL)
+    assert uncapped > height
+
+
+def test_long_token_ellipsis_keeps_the_visible_lines():
+    pdf = PDFTable()
+    w = pdf.table_cols(2, 10)[1]
+    text_that_fits, text_overflow = pdf.fit_text_fixed_height(URL, 5, w, 15, ellipsis=True)
+    assert text_that_fits.startswith('see https://example.com/aaa') and text_that_fits.endswith('...')
+    assert len(split_lines(pdf, w, text_that_fits)) == 3
+    assert text_that_fits[:-3] + text_overflow == URL
+
+
+def test_new_lines_are_kept():
+    pdf = PDFTable()
+    assert pdf.fit_text_fixed_height('alpha\nbeta\ngamma\ndelta', 5, 40, 10) == ('alpha\nbeta', 'gamma\ndelta')
+    assert pdf.fit_text_fixed_height('alpha\nbeta\ngamma\ndelta', 5, 40, 10, ellipsis=True) == \
+        ('alpha\n...', 'beta\ngamma\ndelta')
+    assert pdf.fit_text_fixed_height('alpha\r\nbeta\r\ngamma', 5, 40, 10) == ('alpha\nbeta', 'gamma')
+
+
+def test_truncated_text_fits_the_container():
+    generator = random.Random(0)
+    pdf = PDFTable()
+    for i in range(300):
+        txt = ' '.join(generator.choices(WORDS, k=generator.randint(1, 40)))
+        w, rows = (20, 35, 60)[i % 3], 1 + i % 4
+        for ellipsis in (False, True):
+            text_that_fits, text_overflow = pdf.fit_text_fixed_height(txt, 5, w, rows * 5, ellipsis=ellipsis)
+            assert len(split_lines(pdf, w, text_that_fits)) <= rows, txt
+            if text_overflow:
+                # nothing but the whitespace between both parts is lost
+                visible = text_that_fits[:-3] if ellipsis else text_that_fits
+                assert ''.join((visible + text_overflow).split()) == ''.join(txt.split()), txt
+
+
+@pytest.mark.parametrize('cap', [{'max_rows': 0}, {'max_height': 4}, {'max_rows': 3, 'max_height': 2}])
+def test_cap_smaller_than_a_row(cap):
+    with pytest.raises(HeightError):
+        draw_row(URL, **cap)
+
+
+def test_drawn_lines_are_same_as_multi_cell():
+    generator = random.Random(1)
+    texts = [' '.join(generator.choices(SHORT_WORDS, k=generator.randint(1, 40))) for _ in range(300)]
+    documents = []
+    for pdf in (PDFTable(), MultiCellPDFTable()):
+        for i, txt in enumerate(texts):
+            align = (Align.J, Align.L, Align.R, Align.C)[i % 4]
+            pdf.multi_cell_fixed((20, 35, 60)[i % 3], txt, 5, 5 * (1 + i % 4), align=align, ellipsis=i % 5 == 0,
+                                 line_break=True)
+        documents.append(output(pdf))
+    assert documents[0] == documents[1]
+
+
+def test_long_token_is_drawn_in_the_measured_lines():
+    pdf = PDFTable()
+    pdf.set_compression(False)
+    txt = '\n ' + 'x' * 60
+    text_that_fits, _, text_lines = pdf.calculate_text_fit(txt, 5, 35, 15)
+    assert len(text_lines) == 3 and text_that_fits == '\n ' + 'x' * 24
+    pdf.multi_cell_fixed(35, txt, 5, 15)
+    # the space is left in the second line, the third line starts with the token
+    assert b'(' + b'x' * 24 + b') Tj' in bytes(pdf.pages[1]['content'])
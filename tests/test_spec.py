@@ -0,0 +1,37 @@
+import copy
+import pickle
+
+import pytest
+from fpdf.enums import Align
+
+from fpdf_table import CellStyle, ColumnSpec, PDFTable, StyleRule, TableSpec
+from fpdf_table.main import NumberElementsListMismatchError, WidthOverflowError
+
+
+def test_table_spec_columns():
+    spec = PDFTable().table_spec(1, 2, align=['L', 'R'])
+    assert spec.columns == (ColumnSpec(spec.widths[0], Align.L), ColumnSpec(spec.widths[1], Align.R))
+    assert spec.width == sum(spec.widths)
+    with pytest.raises(AttributeError):
+        spec.width = 0
+
+
+def test_table_spec_validation():
+    with pytest.raises(NumberElementsListMismatchError):
+        TableSpec([10, 20], [Align.L])
+    with pytest.raises(WidthOverflowError):
+        TableSpec([100, 100], [Align.L, Align.L], available_width=150)
+    pdf = PDFTable()
+    with pytest.raises(NumberElementsListMismatchError):
+        pdf.table_row(['a', 'b', 'c'], pdf.table_spec(6, 6))
+
+
+def test_copies_keep_fields():
+    spec = TableSpec([10, 20], [Align.L, Align.C])
+    rule = StyleRule(rows=[1, 3], columns=[0], fill_color=(10, 20, 30), font_style='B')
+    for value in (spec, rule):
+        assert copy.deepcopy(value) == value
+        assert type(pickle.loads(pickle.dumps(value))) is type(value)
+    assert rule.rows == frozenset({1, 3})
+    assert rule.style.font_style == 'B'
+    assert CellStyle(font_style='B').merge(CellStyle(font_style='I')) == CellStyle(font_style='I')
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from fpdf_table import CellStyle, PDFTable, StyleRule, TableStyle
+from fpdf_table.style import convert_color
+
+OPTIONS = [{'option': 'line'}, {'option': 'fixed', 'fixed_height': 10}, {'option': 'responsive'}]
+ROW = ['a', 'b', 'c']
+
+
+def draw(cell_styles, **kwargs) -> tuple[PDFTable, list[str]]:
+    pdf = PDFTable()
+    pdf.set_compression(False)
+    start = len(pdf.pages[1]['content'])
+    pdf.table_row(ROW, pdf.table_cols(4, 4, 4), cell_styles=cell_styles, **kwargs)
+    return pdf, bytes(pdf.pages[1]['content'][start:]).decode('latin-1').split('\n')
+
+
+def cell_lines(lines: list[str], text: str) -> list[str]:
+    # operators written before the cell, from the end of the previous cell
+    end = next(i for i, line in enumerate(lines) if f'({text}) Tj' in line)
+    start = max([i for i, line in enumerate(lines[:end]) if ') Tj' in line], default=-1) + 1
+    return lines[start:end + 1]
+
+
+@pytest.mark.parametrize('kwargs', OPTIONS)
+def test_style_sets_fill_text_color_and_font_of_the_cell(kwargs):
+    style = CellStyle(convert_color((255, 255, 0)), convert_color((200, 0, 0)), 'B')
+    _, lines = draw((None, style, None), **kwargs)
+    styled = '\n'.join(cell_lines(lines, 'b'))
+    assert '1 1 0 rg' in styled and '0.7843 0 0 rg' in styled and '/F2 7.50 Tf' in styled
+    # only the styled cell is filled
+    assert ' re B ' in styled or ' re f' in styled
+    for text in ('a', 'c'):
+        unstyled = '\n'.join(cell_lines(lines, text))
+        assert ' re B ' not in unstyled and ' re f' not in unstyled and '0.7843 0 0 rg' not in unstyled
+
+
+@pytest.mark.parametrize('kwargs', OPTIONS)
+def test_unchanged_style_writes_nothing(kwargs):
+    _, plain = draw(None, **kwargs)
+    _, unstyled = draw((None, None, None), **kwargs)
+    assert unstyled == plain
+    style = CellStyle(font_style='B')
+    _, lines = draw((style, style, style), **kwargs)
+    # the font is set before the first cell and restored after the last one
+    assert sum('Tf' in line for line in cell_lines(lines, 'a')) == 1
+    assert not any('Tf' in line or line.endswith(' rg') for line in cell_lines(lines, 'b') + cell_lines(lines, 'c'))
+
+
+@pytest.mark.parametrize('kwargs', OPTIONS)
+def test_table_state_is_restored_after_every_row(kwargs):
+    style = TableStyle(StyleRule(rows=slice(1, None, 2), fill_color=245),
+                       StyleRule(columns=[2], when=lambda value: value.startswith('-'), text_color=(200, 0, 0),
+                                 font_style='I'))
+    rows = [[str(i), f'name {i}', f'{i * 37 % 100 - 50}'] for i in range(6)]
+    pdf = PDFTable()
+    state = pdf.get_style_state()
+    font = (pdf.font_family, pdf.font_style, pdf.font_size_pt)
+    for row, cell_styles in zip(rows, style.calculate_styles(rows)):
+        pdf.table_row(row, pdf.table_cols(4, 4, 4), cell_styles=cell_styles, **kwargs)
+        assert pdf.get_style_state() == state
+        assert (pdf.font_family, pdf.font_style, pdf.font_size_pt) == font
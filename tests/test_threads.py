@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fpdf_table import PDFTable, PDFTablePool, StyleRule, TableStyle
+from tests.utils import create_pdf_lato, output
+
+DOCUMENTS = 16
+# shared by every thread
+STYLE = TableStyle(StyleRule(rows=slice(1, None, 2), fill_color=240),
+                   StyleRule(columns=[1], when=lambda value: value.startswith('-'), text_color=(200, 0, 0),
+                             font_style='B'))
+
+
+def draw(pdf: PDFTable, n: int) -> bytes:
+    """
+    draw a different document for every n, with TTF or core fonts, grid borders, bands and the shared style.
+    """
+    if n % 3 == 0:
+        pdf.font = 'Lato'
+    elif n % 3 == 1:
+        pdf.font = 'Courier'
+        pdf.row_height_multi_cell = 4
+        pdf.grid_borders = True
+    pdf.text_normal_size = 6 + n % 4
+    pdf.set_defaults()
+    rows = [[str(i), str(i * n % 300 - 100), 'texto largo ' * (i % 7)] for i in range(100)]
+    if n % 2:
+        columns = pdf.table_cols(2, 2, 8)
+        pdf.table_header(['id', 'n', 'texto'], columns)
+        pdf.table_rows(rows, columns, option='responsive', style=STYLE)
+    else:
+        pdf.table_bands(['id', 'n', 'texto'], rows, pdf.table_cols(1, 1, 2), option='responsive', style=STYLE)
+    return output(pdf)
+
+
+def draw_new(n: int) -> bytes:
+    return draw(create_pdf_lato(), n)
+
+
+def test_threads_draw_same_documents_as_serial():
+    serial = [draw_new(n) for n in range(DOCUMENTS)]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(draw_new, range(DOCUMENTS))) == serial
+
+
+def test_threads_with_pool_draw_same_documents_as_serial():
+    serial = [draw_new(n) for n in range(DOCUMENTS)]
+    pool = PDFTablePool(create_pdf_lato, max_size=4)
+
+    def draw_pooled(n: int) -> bytes:
+        with pool.pdf() as pdf:
+            document = draw(pdf, n)
+            # reset keeps the configuration, the next document starts from the defaults like a new instance
+            for attribute in ('font', 'row_height_multi_cell', 'grid_borders', 'text_normal_size'):
+                setattr(pdf, attribute, getattr(PDFTable, attribute))
+            return document
+
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(draw_pooled, range(DOCUMENTS))) == serial
+
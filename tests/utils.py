@@ -0,0 +1,62 @@
+import datetime
+import math
+import os
+
+from fpdf_table import PDFTable
+
+FONT_FILE = os.path.join(os.path.dirname(__file__), 'fonts', 'Lato-Regular.ttf')
+# fpdf writes the creation date, fixed so documents can be compared byte by byte
+CREATION_DATE = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def output(pdf: PDFTable) -> bytes:
+    """
+    render a document with a fixed creation date.
+
+    :param pdf: PDFTable
+    :return: PDF bytes
+    """
+    pdf.set_creation_date(CREATION_DATE)
+    return bytes(pdf.output())
+
+
+def create_pdf_lato() -> PDFTable:
+    """
+    PDFTable with Lato added as a regular and bold TTF font.
+
+    :return: PDFTable
+    """
+    pdf = PDFTable()
+    pdf.add_font('Lato', '', FONT_FILE)
+    pdf.add_font('Lato', 'B', FONT_FILE)
+    return pdf
+
+
+class RecordingPDFTable(PDFTable):
+    """
+    PDFTable that records where every header and row is drawn.
+    """
+
+    def __init__(self):
+        self.drawn = []
+        super().__init__()
+
+    def table_header(self, *args, **kwargs):
+        self.drawn.append((self.page, self.x, self.y, self.row_height_cell))
+        super().table_header(*args, **kwargs)
+
+    def table_row(self, text_list, *args, **kwargs):
+        y = self.y
+        super().table_row(text_list, *args, **kwargs)
+        self.drawn.append((self.page, self.x, y, self.y - y))
+
+
+def assert_inside_pages(pdf: RecordingPDFTable):
+    """
+    check that every header and row was drawn above the page break trigger.
+
+    :param pdf: RecordingPDFTable
+    :return:
+    """
+    for page, x, y, height in pdf.drawn:
+        assert y + height <= pdf.page_break_trigger or math.isclose(y + height, pdf.page_break_trigger)